@@ -36,7 +36,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Any) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -51,6 +55,8 @@ def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section)
     assert configuration is not None
 
+    # Each env.py run builds its own engine, so there is nothing to keep warm;
+    # NullPool plus an immediate dispose closes the connection when done.
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
@@ -58,10 +64,11 @@ def run_migrations_online() -> None:
         future=True,
     )
 
-    with connectable.connect() as connection:
-        do_run_migrations(connection)
-    connectable.dispose()
-
+    try:
+        with connectable.connect() as connection:
+            do_run_migrations(connection)
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
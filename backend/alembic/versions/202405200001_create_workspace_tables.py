@@ -146,6 +146,6 @@ def downgrade() -> None:
     op.drop_index("ix_workspace_members_workspace_id", table_name="workspace_members")
     op.drop_table("workspace_members")
     op.drop_table("workspaces")
-    compliance_status.drop(op.get_bind(), checkfirst=False)
-    membership_status.drop(op.get_bind(), checkfirst=False)
-    workspace_role.drop(op.get_bind(), checkfirst=False)
+    op.execute("DROP TYPE IF EXISTS compliancestatus")
+    op.execute("DROP TYPE IF EXISTS membershipstatus")
+    op.execute("DROP TYPE IF EXISTS workspacerole")
@@ -0,0 +1,42 @@
+"""Index workspace user foreign keys and recent runs"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202405200003"
+down_revision = "202405200001"
+branch_labels = None
+depends_on = None
+
+
+# Without these indexes every user deletion seq-scans the child tables to
+# apply ON DELETE SET NULL.
+INDEXES = (
+    ("ix_workspaces_created_by_id", "workspaces", "created_by_id"),
+    ("ix_workspace_members_invited_by_id", "workspace_members", "invited_by_id"),
+    ("ix_workspace_runs_triggered_by_id", "workspace_runs", "triggered_by_id"),
+    # Recent runs per workspace, in list_workspace_runs' (created_at, id) order
+    ("ix_workspace_runs_workspace_id_created_at_id", "workspace_runs", "workspace_id, created_at DESC, id DESC"),
+)
+
+# Covered by the leading workspace_id column of the recent-runs index above.
+SUPERSEDED_INDEXES = (
+    ("ix_workspace_runs_workspace_id", "workspace_runs", "workspace_id"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+        for name, _, _ in SUPERSEDED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in SUPERSEDED_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,52 @@
+"""Store workspace JSON payloads as jsonb"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "202405200004"
+down_revision = "202405200003"
+branch_labels = None
+depends_on = None
+
+
+JSONB_COLUMNS = (
+    ("workspaces", "settings"),
+    ("workspace_runs", "stage_metrics"),
+    ("workspace_runs", "telemetry"),
+    ("workspace_runs", "compliance_report"),
+    ("workspace_runs", "evaluation_report"),
+    ("workspace_runs", "pipeline_config"),
+)
+
+
+def upgrade() -> None:
+    # The initial revision created these columns as json.
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workspace_runs_telemetry_gin "
+            "ON workspace_runs USING gin (telemetry jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workspace_runs_telemetry_gin")
+
+    for table, column in reversed(JSONB_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
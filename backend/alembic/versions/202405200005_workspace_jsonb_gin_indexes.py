@@ -0,0 +1,34 @@
+"""Index workspace jsonb columns for containment queries"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202405200005"
+down_revision = "202405200004"
+branch_labels = None
+depends_on = None
+
+
+# jsonb_path_ops only supports @> but is much smaller than the default
+# jsonb_ops, and containment is how flags and run payloads are queried.
+INDEXES = (
+    ("ix_workspaces_settings_gin", "workspaces", "settings"),
+    ("ix_workspace_runs_stage_metrics_gin", "workspace_runs", "stage_metrics"),
+    ("ix_workspace_runs_pipeline_config_gin", "workspace_runs", "pipeline_config"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,26 @@
+"""Trigram index for workspace name search"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202405200006"
+down_revision = "202405200005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workspaces_name_trgm "
+            "ON workspaces USING gin (lower(name) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workspaces_name_trgm")
@@ -0,0 +1,30 @@
+"""Index workspace listings in their sort order"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202405200008"
+down_revision = "202405200007"
+branch_labels = None
+depends_on = None
+
+
+# list_workspaces orders by (created_at DESC, id DESC); with id in the index
+# keyset pages are a bounded range scan with no sort step. Runs already have
+# the matching index from 202405200003.
+INDEXES = (
+    ("ix_workspaces_created_at_id", "workspaces", "created_at DESC, id DESC"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
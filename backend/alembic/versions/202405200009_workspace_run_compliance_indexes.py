@@ -0,0 +1,40 @@
+"""Index workspace runs by compliance outcome"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202405200009"
+down_revision = "202405200008"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    # Partial: only review/fail runs, which dashboards list most recent first
+    (
+        "ix_workspace_runs_attention",
+        "workspace_runs",
+        "workspace_id, created_at DESC",
+        "compliance_status <> 'pass'",
+    ),
+    (
+        "ix_workspace_runs_workspace_id_compliance_status",
+        "workspace_runs",
+        "workspace_id, compliance_status",
+        None,
+    ),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            predicate = f" WHERE {where}" if where else ""
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns}){predicate}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncGenerator
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_async_db
+from app.core.database import AsyncSessionLocal, get_async_db
+from app.services.audit import AuditLogBuffer
+
+logger = logging.getLogger(__name__)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -14,3 +19,25 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_async_db():
         yield session
 
+
+
+async def get_audit_buffer() -> AsyncGenerator[AuditLogBuffer, None]:
+    """Yield a request-scoped audit buffer, inserting its rows when the request ends.
+
+    Rows are written even when the route raises, since failed logins and
+    permission errors are the entries that matter most. They go through a
+    dedicated session so the route's own pending changes are never committed
+    as a side effect.
+    """
+    buffer = AuditLogBuffer()
+    try:
+        yield buffer
+    finally:
+        pending = len(buffer)
+        if pending:
+            try:
+                async with AsyncSessionLocal() as audit_db:
+                    await buffer.flush(audit_db)
+            except SQLAlchemyError:
+                # Never replace the route's own error with an audit failure
+                logger.exception("Failed to write %d audit log rows", pending)
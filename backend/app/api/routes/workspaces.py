@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import Field
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db_session
+from app.models.workspace import Workspace
 from app.schemas.workspace import (
     WorkspaceCreate,
     WorkspaceListResponse,
@@ -19,18 +22,26 @@ from app.schemas.workspace import (
     WorkspaceWithRuns,
 )
 from app.services.workspaces import (
+    InvalidCursorError,
     WorkspaceAlreadyExistsError,
+    count_workspaces,
     create_workspace,
     create_workspace_run,
-    get_workspace_by_public_id,
-    get_workspace_by_slug,
+    decode_cursor,
+    estimate_row_count,
     get_workspace_run_by_public_ids,
+    get_workspace_with_recent_runs,
     list_workspace_runs,
     list_workspaces,
+    load_workspace,
 )
 
 router = APIRouter(prefix="/workspaces", tags=["workspaces"])
 
+# OFFSET makes Postgres read and discard every skipped row; deeper pages must
+# follow next_cursor instead.
+MAX_PAGE_OFFSET = 1000
+
 
 class WorkspaceCreateRequest(WorkspaceCreate):
     members: list[WorkspaceMemberCreate] = Field(default_factory=list)
@@ -41,14 +52,21 @@ class WorkspaceRunCreateRequest(WorkspaceRunCreate):
 
 
 async def _resolve_workspace(db: AsyncSession, workspace_id: str):
-    workspace = await get_workspace_by_public_id(db, workspace_id)
-    if not workspace:
-        workspace = await get_workspace_by_slug(db, workspace_id)
+    workspace = await load_workspace(db, workspace_id)
     if not workspace:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
     return workspace
 
 
+def _decode_cursor(cursor: Optional[str]):
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor")
+
+
 @router.post("/", response_model=WorkspaceRead, status_code=status.HTTP_201_CREATED)
 async def create_workspace_endpoint(
     payload: WorkspaceCreateRequest,
@@ -65,10 +83,23 @@ async def create_workspace_endpoint(
 async def list_workspaces_endpoint(
     db: AsyncSession = Depends(get_db_session),
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, le=MAX_PAGE_OFFSET, description="Shallow pages only; use cursor beyond this"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; overrides offset"),
+    exact_count: bool = Query(False, description="Also return the exact workspace count (full table scan)"),
 ) -> WorkspaceListResponse:
-    workspaces, total = await list_workspaces(db, limit=limit, offset=offset)
-    return WorkspaceListResponse(items=workspaces, total=total)
+    workspaces, next_cursor = await list_workspaces(
+        db, limit=limit, offset=offset, cursor=_decode_cursor(cursor)
+    )
+    estimated_total = await estimate_row_count(db, Workspace.__tablename__)
+    # COUNT(*) scans the whole table, so it only runs when explicitly requested
+    total = await count_workspaces(db) if exact_count else None
+    rows_seen = len(workspaces) + (offset if cursor is None else 0)
+    if estimated_total is None or estimated_total < rows_seen:
+        # Never analyzed, or statistics older than the rows just returned
+        estimated_total = total if total is not None else await count_workspaces(db)
+    return WorkspaceListResponse(
+        items=workspaces, total=total, estimated_total=estimated_total, next_cursor=next_cursor
+    )
 
 
 @router.get("/{workspace_id}", response_model=WorkspaceWithRuns)
@@ -77,9 +108,9 @@ async def get_workspace_endpoint(
     db: AsyncSession = Depends(get_db_session),
     run_limit: int = Query(10, ge=1, le=100, description="Number of recent runs to include"),
 ) -> WorkspaceWithRuns:
-    workspace = await _resolve_workspace(db, workspace_id)
-    runs, _ = await list_workspace_runs(db, workspace, limit=run_limit, offset=0)
-    workspace.runs = runs  # type: ignore[attr-defined]
+    workspace = await get_workspace_with_recent_runs(db, workspace_id, run_limit=run_limit)
+    if not workspace:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
     return workspace
 
 
@@ -88,11 +119,15 @@ async def list_workspace_runs_endpoint(
     workspace_id: str,
     db: AsyncSession = Depends(get_db_session),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, le=MAX_PAGE_OFFSET, description="Shallow pages only; use cursor beyond this"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; overrides offset"),
 ) -> WorkspaceRunListResponse:
+    run_cursor = _decode_cursor(cursor)
     workspace = await _resolve_workspace(db, workspace_id)
-    runs, total = await list_workspace_runs(db, workspace, limit=limit, offset=offset)
-    return WorkspaceRunListResponse(items=runs, total=total)
+    runs, next_cursor, total = await list_workspace_runs(
+        db, workspace, limit=limit, offset=offset, cursor=run_cursor
+    )
+    return WorkspaceRunListResponse(items=runs, total=total, next_cursor=next_cursor)
 
 
 @router.post("/{workspace_id}/runs", response_model=WorkspaceRunRead, status_code=status.HTTP_201_CREATED)
@@ -1,16 +1,42 @@
 """Redis cache configuration and utilities."""
 
-import json
 import logging
-from typing import Any, Optional, Union
+from typing import Any, Awaitable, Callable, Optional, Union
 
+import orjson
 import redis.asyncio as aioredis
-from redis.exceptions import ConnectionError, RedisError
+from cachetools import TTLCache
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# json.dumps accepted int-keyed dicts; keep that behaviour under orjson.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Keys scanned and unlinked per round-trip in clear_pattern.
+CLEAR_BATCH_SIZE = 500
+
+# Upper bound on keys per MGET so one call never builds a huge command buffer.
+GET_MANY_BATCH_SIZE = 1000
+
+# SET ... EX for every key in a single command dispatch. ARGV holds one value
+# per key followed by the shared TTL.
+SET_MANY_SCRIPT = """
+local ttl = ARGV[#KEYS + 1]
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, ARGV[i], 'EX', ttl)
+end
+return #KEYS
+"""
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for storage in Redis."""
+    return orjson.dumps(value, default=str, option=ORJSON_OPTIONS)
+
 
 class CacheManager:
     """Redis cache manager for async operations."""
@@ -22,47 +48,112 @@ class CacheManager:
             redis_url: Redis connection URL
         """
         self.redis_url = redis_url or settings.REDIS_URL
-        self._redis: Optional[aioredis.Redis] = None
+        self.redis: Optional[aioredis.Redis] = None
+        self._set_many_script: Optional[AsyncScript] = None
+        # Short-lived in-process copy of raw payloads read by get(); absorbs
+        # bursts of reads for hot keys. Writes through this instance evict.
+        self._local: TTLCache = TTLCache(
+            maxsize=settings.CACHE_LOCAL_MAXSIZE,
+            ttl=settings.CACHE_LOCAL_TTL,
+        )
+        # Bumped on every local eviction. get() only stores what it read from
+        # Redis if no write evicted anything while it was awaiting the read.
+        self._local_generation = 0
     
     async def connect(self) -> None:
         """Connect to Redis."""
         try:
-            self._redis = aioredis.from_url(
+            # Raw bytes responses go straight to orjson; the blocking pool
+            # makes bursts wait for a free connection instead of opening more.
+            pool = aioredis.BlockingConnectionPool.from_url(
                 self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
                 socket_keepalive=True,
                 socket_keepalive_options={},
                 retry_on_timeout=True,
                 health_check_interval=30,
             )
-            # Test connection
-            await self._redis.ping()
+            self.redis = aioredis.Redis(connection_pool=pool)
+            # Sent with EVALSHA; redis-py reloads the script on NOSCRIPT
+            self._set_many_script = self.redis.register_script(SET_MANY_SCRIPT)
+            # Test connection. The client is kept on failure: it reconnects on
+            # the next command, and until then cache calls log and miss.
+            await self.redis.ping()
             logger.info("Connected to Redis successfully")
-        except ConnectionError as e:
-            logger.error(f"Failed to connect to Redis: {e}")
-            self._redis = None
+        except RedisError as e:
+            logger.error("Failed to connect to Redis: %s", e)
             raise
     
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
-        if self._redis:
-            await self._redis.close()
+        if self.redis:
+            await self.redis.close(close_connection_pool=True)
             logger.info("Disconnected from Redis")
     
-    @property
-    def redis(self) -> aioredis.Redis:
-        """Get Redis client instance.
+    def assert_connected(self) -> None:
+        """Ensure connect() has succeeded.
+        
+        Called once at application startup so cache calls can use the client
+        attribute directly.
         
-        Returns:
-            Redis client
-            
         Raises:
             RuntimeError: If not connected to Redis
         """
-        if not self._redis:
+        if self.redis is None:
             raise RuntimeError("Redis client not initialized. Call connect() first.")
-        return self._redis
+    
+    def _evict_local(self, *keys: str) -> None:
+        """Drop keys from the in-process cache once a write has finished.
+        
+        Evicting after the write (rather than before) also stops a get() that
+        read the old value while the write was in flight from storing it.
+        """
+        for key in keys:
+            self._local.pop(key, None)
+        self._local_generation += 1
+    
+    def _available(self, action: str) -> bool:
+        """Report whether there is a client to send commands to.
+        
+        connect() leaves the client unset when it fails before creating one;
+        cache calls then log and miss instead of raising.
+        
+        Args:
+            action: Operation name used in the warning log
+            
+        Returns:
+            True if a Redis client is set, False otherwise
+        """
+        if self.redis is None:
+            logger.warning("Cache %s skipped: Redis client not initialized", action)
+            return False
+        return True
+    
+    async def _run(
+        self,
+        action: str,
+        key: str,
+        command: Callable[[aioredis.Redis], Awaitable[Any]],
+    ) -> Any:
+        """Run a single-key Redis command, logging and swallowing Redis errors.
+        
+        Args:
+            action: Operation name used in the error log
+            key: Cache key the command targets
+            command: Called with the Redis client; returns the command coroutine
+            
+        Returns:
+            Command result, or None on error or when not connected
+        """
+        if not self._available(action):
+            return None
+        try:
+            return await command(self.redis)
+        except RedisError as e:
+            logger.error("Cache %s error for key %s: %s", action, key, e)
+            return None
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
@@ -73,13 +164,18 @@ class CacheManager:
         Returns:
             Cached value or None if not found
         """
-        try:
-            value = await self.redis.get(key)
+        value = self._local.get(key)
+        if value is None:
+            generation = self._local_generation
+            value = await self._run("get", key, lambda redis: redis.get(key))
             if value is None:
                 return None
-            return json.loads(value)
-        except (RedisError, json.JSONDecodeError) as e:
-            logger.error(f"Cache get error for key {key}: {e}")
+            if generation == self._local_generation:
+                self._local[key] = value
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError as e:
+            logger.error("Cache get error for key %s: %s", key, e)
             return None
     
     async def set(
@@ -99,13 +195,15 @@ class CacheManager:
             True if successful, False otherwise
         """
         try:
-            serialized = json.dumps(value, default=str)
-            ttl = ttl or settings.CACHE_TTL
-            await self.redis.set(key, serialized, ex=ttl)
-            return True
-        except (RedisError, json.JSONEncodeError) as e:
-            logger.error(f"Cache set error for key {key}: {e}")
+            serialized = _dumps(value)
+        except orjson.JSONEncodeError as e:
+            logger.error("Cache set error for key %s: %s", key, e)
             return False
+        ttl = ttl or settings.CACHE_TTL
+        try:
+            return bool(await self._run("set", key, lambda redis: redis.set(key, serialized, ex=ttl)))
+        finally:
+            self._evict_local(key)
     
     async def delete(self, key: str) -> bool:
         """Delete value from cache.
@@ -117,11 +215,9 @@ class CacheManager:
             True if successful, False otherwise
         """
         try:
-            result = await self.redis.delete(key)
-            return bool(result)
-        except RedisError as e:
-            logger.error(f"Cache delete error for key {key}: {e}")
-            return False
+            return bool(await self._run("delete", key, lambda redis: redis.delete(key)))
+        finally:
+            self._evict_local(key)
     
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache.
@@ -132,12 +228,7 @@ class CacheManager:
         Returns:
             True if key exists, False otherwise
         """
-        try:
-            result = await self.redis.exists(key)
-            return bool(result)
-        except RedisError as e:
-            logger.error(f"Cache exists check error for key {key}: {e}")
-            return False
+        return bool(await self._run("exists check", key, lambda redis: redis.exists(key)))
     
     async def increment(self, key: str, amount: int = 1) -> Optional[int]:
         """Increment a numeric value in cache.
@@ -150,11 +241,9 @@ class CacheManager:
             New value after increment, or None on error
         """
         try:
-            result = await self.redis.incrby(key, amount)
-            return result
-        except RedisError as e:
-            logger.error(f"Cache increment error for key {key}: {e}")
-            return None
+            return await self._run("increment", key, lambda redis: redis.incrby(key, amount))
+        finally:
+            self._evict_local(key)
     
     async def expire(self, key: str, ttl: int) -> bool:
         """Set expiration time for a key.
@@ -166,12 +255,7 @@ class CacheManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            result = await self.redis.expire(key, ttl)
-            return bool(result)
-        except RedisError as e:
-            logger.error(f"Cache expire error for key {key}: {e}")
-            return False
+        return bool(await self._run("expire", key, lambda redis: redis.expire(key, ttl)))
     
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
         """Get multiple values from cache.
@@ -182,18 +266,26 @@ class CacheManager:
         Returns:
             Dictionary of key-value pairs
         """
+        if not keys or not self._available("get_many"):
+            return {}
         try:
-            values = await self.redis.mget(keys)
+            if len(keys) <= GET_MANY_BATCH_SIZE:
+                values = await self.redis.mget(keys)
+            else:
+                pipe = self.redis.pipeline(transaction=False)
+                for start in range(0, len(keys), GET_MANY_BATCH_SIZE):
+                    pipe.mget(keys[start:start + GET_MANY_BATCH_SIZE])
+                values = [value for batch in await pipe.execute() for value in batch]
             result = {}
             for key, value in zip(keys, values):
                 if value is not None:
                     try:
-                        result[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to decode cached value for key {key}")
+                        result[key] = orjson.loads(value)
+                    except orjson.JSONDecodeError:
+                        logger.warning("Failed to decode cached value for key %s", key)
             return result
         except RedisError as e:
-            logger.error(f"Cache get_many error: {e}")
+            logger.error("Cache get_many error: %s", e)
             return {}
     
     async def set_many(
@@ -210,19 +302,22 @@ class CacheManager:
         Returns:
             True if successful, False otherwise
         """
+        if not data:
+            return True
         try:
-            pipe = self.redis.pipeline()
+            if not self._available("set_many"):
+                return False
             ttl = ttl or settings.CACHE_TTL
+            args = [_dumps(value) for value in data.values()]
+            args.append(ttl)
             
-            for key, value in data.items():
-                serialized = json.dumps(value, default=str)
-                pipe.set(key, serialized, ex=ttl)
-            
-            await pipe.execute()
+            await self._set_many_script(keys=list(data), args=args, client=self.redis)
             return True
-        except (RedisError, json.JSONEncodeError) as e:
-            logger.error(f"Cache set_many error: {e}")
+        except (RedisError, orjson.JSONEncodeError) as e:
+            logger.error("Cache set_many error: %s", e)
             return False
+        finally:
+            self._evict_local(*data)
     
     async def clear_pattern(self, pattern: str) -> int:
         """Clear all keys matching a pattern.
@@ -234,14 +329,28 @@ class CacheManager:
             Number of keys deleted
         """
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                deleted = await self.redis.delete(*keys)
-                return deleted
-            return 0
+            if not self._available("clear_pattern"):
+                return 0
+            deleted = 0
+            pending = 0
+            pipe = self.redis.pipeline(transaction=False)
+            # SCAN walks the keyspace incrementally instead of blocking Redis
+            # like KEYS; UNLINK frees the values off the main thread.
+            async for key in self.redis.scan_iter(match=pattern, count=CLEAR_BATCH_SIZE):
+                pipe.unlink(key)
+                pending += 1
+                if pending >= CLEAR_BATCH_SIZE:
+                    deleted += sum(await pipe.execute())
+                    pending = 0
+            if pending:
+                deleted += sum(await pipe.execute())
+            return deleted
         except RedisError as e:
-            logger.error(f"Cache clear_pattern error for pattern {pattern}: {e}")
+            logger.error("Cache clear_pattern error for pattern %s: %s", pattern, e)
             return 0
+        finally:
+            self._local.clear()
+            self._local_generation += 1
     
     async def health_check(self) -> dict:
         """Check Redis health status.
@@ -249,15 +358,21 @@ class CacheManager:
         Returns:
             Health status dictionary
         """
+        if self.redis is None:
+            return {
+                "redis": "unhealthy",
+                "connection": "not initialized",
+                "error": "Redis client not initialized",
+            }
         try:
-            # Test basic operations
-            await self.redis.ping()
-            await self.redis.set("health_check", "ok", ex=1)
-            value = await self.redis.get("health_check")
-            await self.redis.delete("health_check")
-            
-            # Get Redis info
-            info = await self.redis.info()
+            # Test basic operations and fetch server info in one round-trip
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.ping()
+            pipe.set("health_check", "ok", ex=1)
+            pipe.get("health_check")
+            pipe.delete("health_check")
+            pipe.info()
+            _, _, value, _, info = await pipe.execute()
             
             return {
                 "redis": "healthy",
@@ -265,10 +380,10 @@ class CacheManager:
                 "version": info.get("redis_version"),
                 "connected_clients": info.get("connected_clients"),
                 "used_memory_human": info.get("used_memory_human"),
-                "test_operation": "success" if value == "ok" else "failed",
+                "test_operation": "success" if value == b"ok" else "failed",
             }
         except Exception as e:
-            logger.error(f"Redis health check failed: {e}")
+            logger.error("Redis health check failed: %s", e)
             return {
                 "redis": "unhealthy",
                 "connection": "failed",
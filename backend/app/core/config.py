@@ -1,15 +1,17 @@
 """Application configuration settings."""
 
 import os
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, List, Literal, Optional, Union
 
-from pydantic import AnyHttpUrl, BaseSettings, PostgresDsn, validator
+from pydantic import AnyHttpUrl, Field, PostgresDsn, PrivateAttr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
+    
     # API Configuration
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Launchloom API"
@@ -28,27 +30,47 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
-    PASSWORD_HASH_ALGORITHM: str = "bcrypt"
+    JWT_VERIFY_CACHE_TTL: int = 30  # seconds a verified token payload is reused
+    PASSWORD_HASH_ALGORITHM: Literal["bcrypt", "argon2id"] = "bcrypt"
+    BCRYPT_COST: int = 12  # drop to 4 in tests; each step doubles hashing time
+    BCRYPT_WORKERS: int = 4
     
     # Database Configuration
-    DATABASE_URL: Optional[PostgresDsn] = None
+    DATABASE_URL: Optional[PostgresDsn] = Field(None, validate_default=True)
     DATABASE_TEST_URL: Optional[PostgresDsn] = None
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 3600
+    DB_SYNC_POOL_SIZE: int = 2  # sync engine only serves admin tasks
+    DB_SYNC_MAX_OVERFLOW: int = 2
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False  # disables statement caches
+    # Migrations run as a separate job (`alembic upgrade head`). "check" makes
+    # the API refuse to start until the database is at the migration head.
+    MIGRATION_MODE: Literal["skip", "check"] = "skip"
     
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379/0"
     CACHE_TTL: int = 3600  # 1 hour
+    # Writes evict only the writing process's local copy; other workers can
+    # keep serving the previous value for up to CACHE_LOCAL_TTL seconds.
+    CACHE_LOCAL_TTL: int = 2  # seconds a worker may serve a value without asking Redis
+    CACHE_LOCAL_MAXSIZE: int = 10_000
     SESSION_TTL: int = 86400  # 24 hours
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: int = 5  # seconds to wait for a free connection
+    REDIS_SOCKET_TIMEOUT: int = 5
+    # When False the API starts without Redis and cache calls miss until it
+    # becomes reachable; True refuses to start if Redis cannot be pinged.
+    REDIS_REQUIRED: bool = False
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_BURST: int = 100
     
     # CORS Settings
-    ALLOWED_ORIGINS: List[AnyHttpUrl] = []
+    # The str member lets comma separated env values reach the validator
+    ALLOWED_ORIGINS: Union[List[AnyHttpUrl], str] = []
     ALLOWED_METHODS: List[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
     ALLOWED_HEADERS: List[str] = ["*"]
     
@@ -78,54 +100,62 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     TESTING: bool = False
     
-    @validator("ALLOWED_ORIGINS", pre=True)
+    # Environment flags derived once at construction
+    _is_production: bool = PrivateAttr(False)
+    _is_development: bool = PrivateAttr(False)
+    _is_testing: bool = PrivateAttr(False)
+    
+    def model_post_init(self, __context: Any) -> None:
+        environment = self.ENVIRONMENT.lower()
+        self._is_production = environment == "production"
+        self._is_development = environment in ("development", "dev")
+        self._is_testing = self.TESTING or environment in ("test", "testing")
+    
+    @field_validator("ALLOWED_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         """Parse CORS origins from string or list."""
         if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
+            return [i.strip() for i in v.split(",") if i.strip()]
         elif isinstance(v, (list, str)):
             return v
         raise ValueError(v)
     
-    @validator("DATABASE_URL", pre=True)
-    def assemble_db_connection(cls, v: Optional[str], values: Dict[str, Any]) -> Any:
+    @field_validator("DATABASE_URL", mode="before")
+    @classmethod
+    def assemble_db_connection(cls, v: Optional[str]) -> Any:
         """Build database URL from components if not provided."""
         if isinstance(v, str):
             return v
         return PostgresDsn.build(
             scheme="postgresql",
-            user=os.getenv("DB_USER", "i2s_user"),
+            username=os.getenv("DB_USER", "i2s_user"),
             password=os.getenv("DB_PASSWORD", "password"),
             host=os.getenv("DB_HOST", "localhost"),
-            port=os.getenv("DB_PORT", "5432"),
-            path=f"/{os.getenv('DB_NAME', 'i2s_db')}",
+            port=int(os.getenv("DB_PORT", "5432")),
+            path=os.getenv("DB_NAME", "i2s_db"),
         )
     
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.ENVIRONMENT.lower() == "production"
+        return self._is_production
     
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.ENVIRONMENT.lower() in ["development", "dev"]
+        return self._is_development
     
     @property
     def is_testing(self) -> bool:
         """Check if running in test environment."""
-        return self.TESTING or self.ENVIRONMENT.lower() in ["test", "testing"]
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+        return self._is_testing
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+# Global settings instance
+settings = Settings()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get application settings."""
+    return settings
@@ -1,9 +1,12 @@
 """Database configuration and session management."""
 
+import asyncio
 import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine, pool
+from sqlalchemy import Engine, create_engine, pool, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
@@ -15,23 +18,35 @@ logger = logging.getLogger(__name__)
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
-# Synchronous database engine (for migrations and admin tasks)
-engine = create_engine(
-    str(settings.DATABASE_URL),
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    poolclass=pool.QueuePool,
-    echo=settings.is_development,  # Log SQL in development
-)
+@lru_cache(maxsize=1)
+def get_sync_engine() -> Engine:
+    """Synchronous database engine for admin tasks, created on first use.
+    
+    API workers only use the async engine, so they never open sync connections.
+    
+    Returns:
+        Shared synchronous engine
+    """
+    return create_engine(
+        str(settings.DATABASE_URL),
+        pool_size=settings.DB_SYNC_POOL_SIZE,
+        max_overflow=settings.DB_SYNC_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        poolclass=pool.QueuePool,
+        echo=settings.is_development,  # Log SQL in development
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sync_sessionmaker() -> sessionmaker:
+    """Synchronous session factory bound to the lazily created engine."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_sync_engine()
+    )
 
-# Synchronous session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
 
 # Asynchronous database engine (for API requests)
 async_engine = create_async_engine(
@@ -40,7 +55,17 @@ async_engine = create_async_engine(
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_recycle=settings.DB_POOL_RECYCLE,
+    poolclass=pool.AsyncAdaptedQueuePool,
+    # Reuse the most recently returned connection so its backend caches stay warm
+    pool_use_lifo=True,
     echo=settings.is_development,  # Log SQL in development
+    connect_args={
+        # JIT compilation only pays off for long analytical queries
+        "server_settings": {"jit": "off", "application_name": settings.PROJECT_NAME},
+        # PgBouncer in transaction mode cannot keep prepared statements alive
+        "prepared_statement_cache_size": 0 if settings.DB_PGBOUNCER_TRANSACTION_MODE else 500,
+        "statement_cache_size": 0 if settings.DB_PGBOUNCER_TRANSACTION_MODE else 500,
+    },
 )
 
 # Asynchronous session factory
@@ -59,7 +84,7 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         Database session
     """
-    db = SessionLocal()
+    db = get_sync_sessionmaker()()
     try:
         yield db
     finally:
@@ -90,16 +115,61 @@ async def init_db() -> None:
         logger.info("Database tables created successfully")
 
 
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def _current_heads(connection) -> set[str]:
+    from alembic.runtime.migration import MigrationContext
+
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+async def check_schema_version() -> None:
+    """Fail fast when the database is not at the latest migration.
+    
+    Raises:
+        RuntimeError: If the applied revisions differ from the script heads
+    """
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config(str(ALEMBIC_INI_PATH))
+    # script_location in alembic.ini is relative to backend/; anchor it so the
+    # check works whatever directory the API was started from.
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    script = ScriptDirectory.from_config(config)
+    expected = set(script.get_heads())
+    async with async_engine.connect() as conn:
+        current = await conn.run_sync(_current_heads)
+
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at {sorted(current) or 'base'}, expected {sorted(expected)}. "
+            "Run `alembic upgrade head` before starting the API."
+        )
+    logger.info("Database schema is at head %s", ", ".join(sorted(expected)))
+
+
 async def close_db() -> None:
     """Close database connections."""
     await async_engine.dispose()
-    engine.dispose()
+    if get_sync_engine.cache_info().currsize:
+        get_sync_engine().dispose()
     logger.info("Database connections closed")
 
 
+# Seconds before a hung database fails the health probe
+HEALTH_CHECK_TIMEOUT = 1.0
+
+
 class DatabaseHealthCheck:
     """Database health check utility."""
     
+    @staticmethod
+    async def _ping() -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
     @staticmethod
     async def check() -> dict:
         """Check database connectivity.
@@ -108,16 +178,17 @@ class DatabaseHealthCheck:
             Health status dictionary
         """
         try:
-            async with AsyncSessionLocal() as session:
-                # Simple query to test connection
-                result = await session.execute("SELECT 1")
-                result.fetchone()
-                
+            # Probe on a bare pooled connection; no ORM session is needed
+            await asyncio.wait_for(
+                DatabaseHealthCheck._ping(),
+                timeout=HEALTH_CHECK_TIMEOUT,
+            )
+            
             return {
                 "database": "healthy",
                 "connection": "active",
                 "pool_size": async_engine.pool.size(),
-                "checked_out": async_engine.pool.checked_out(),
+                "checked_out": async_engine.pool.checkedout(),
             }
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -1,22 +1,86 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
+import hashlib
 import secrets
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import timedelta
 from typing import Any, Optional, Union
 
+import bcrypt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import jws, jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. New hashes use PASSWORD_HASH_ALGORITHM ("bcrypt" or
+# "argon2id"); verification picks the scheme from the stored hash so existing
+# bcrypt hashes keep working after switching.
+ARGON2_HASH_PREFIX = "$argon2"
+_argon2_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Password hashing is deliberately slow; async callers hash on these threads
+# so the event loop keeps serving other requests.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_WORKERS,
+    thread_name_prefix="password-hash",
+)
 
 # Token types
 TOKEN_TYPE_ACCESS = "access"
 TOKEN_TYPE_REFRESH = "refresh"
 
+# create_csrf_token() output: 32 random bytes, base64url without padding
+CSRF_TOKEN_BYTES = 32
+CSRF_TOKEN_LENGTH = 43
+
+# Recently verified token payloads keyed by SHA-256 of the raw token, so a
+# bearer token reused across requests is only signature-checked once per TTL.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.JWT_VERIFY_CACHE_TTL)
+# TTLCache is not thread-safe and sync auth dependencies run on FastAPI's
+# threadpool, so every access goes through this lock.
+_token_cache_lock = threading.Lock()
+
+# Payloads decoded during the current request, keyed by the raw token. Set to a
+# fresh dict per request by start_request_token_cache(); None outside a request.
+_request_token_cache: ContextVar[Optional[dict[str, dict[str, Any]]]] = ContextVar(
+    "_request_token_cache", default=None
+)
+
+
+def start_request_token_cache() -> None:
+    """Give the current request its own decoded-token cache.
+    
+    Called by middleware on request entry so auth dependencies that run
+    several times within one request decode the token only once.
+    """
+    _request_token_cache.set({})
+
+
+class RequestTokenCacheMiddleware:
+    """Pure ASGI middleware that starts a token cache for each HTTP request.
+    
+    Unlike an ``@app.middleware("http")`` function (BaseHTTPMiddleware), this
+    adds no extra task or response stream wrapper per request.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            start_request_token_cache()
+        await self.app(scope, receive, send)
+
 
 def create_access_token(
     subject: Union[str, Any], 
@@ -33,22 +97,24 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
+    # JWT timestamps are integer epoch seconds on the wire
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = now + settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     to_encode = {
         "exp": expire,
         "sub": str(subject),
         "type": token_type,
-        "iat": datetime.utcnow(),
+        "iat": now,
     }
     
-    return jwt.encode(
-        to_encode, 
+    # Serialize claims with orjson and sign the bytes; jwt.encode would
+    # run them through stdlib json.
+    return jws.sign(
+        orjson.dumps(to_encode), 
         settings.JWT_SECRET_KEY, 
         algorithm=settings.JWT_ALGORITHM
     )
@@ -71,6 +137,64 @@ def create_refresh_token(subject: Union[str, Any]) -> str:
     )
 
 
+def _cached_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Return a cached payload unless the token has expired since it was cached.
+    
+    Only payloads that passed jwt.decode are cached, so every other claim was
+    already validated; exp is the one check that changes with time.
+    
+    Args:
+        payload: Previously decoded token payload
+        
+    Returns:
+        The payload unchanged
+        
+    Raises:
+        ExpiredSignatureError: If the token's exp has passed
+    """
+    exp = payload.get("exp")
+    # jwt.decode accepted exp as int-convertible, not necessarily an int
+    if exp is not None and int(exp) < time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
+def _decode_token(token: str) -> dict[str, Any]:
+    """Decode a JWT, reusing a cached payload when the token was seen recently.
+    
+    Args:
+        token: JWT token to decode
+        
+    Returns:
+        Decoded token payload
+        
+    Raises:
+        JWTError: If the token is invalid or expired
+    """
+    request_cache = _request_token_cache.get()
+    if request_cache is not None and token in request_cache:
+        # Long-lived requests (e.g. streaming) can outlive the token
+        return _cached_payload(request_cache[token])
+    
+    key = hashlib.sha256(token.encode()).hexdigest()
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is None:
+        # Decode outside the lock so threads verifying other tokens don't wait
+        payload = jwt.decode(
+            token, 
+            settings.JWT_SECRET_KEY, 
+            algorithms=[settings.JWT_ALGORITHM]
+        )
+        with _token_cache_lock:
+            _token_cache[key] = payload
+    else:
+        _cached_payload(payload)
+    if request_cache is not None:
+        request_cache[token] = payload
+    return payload
+
+
 def verify_token(token: str, token_type: str = TOKEN_TYPE_ACCESS) -> Optional[str]:
     """Verify and decode a JWT token.
     
@@ -85,11 +209,7 @@ def verify_token(token: str, token_type: str = TOKEN_TYPE_ACCESS) -> Optional[st
         HTTPException: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET_KEY, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = _decode_token(token)
         
         subject: str = payload.get("sub")
         token_type_claim: str = payload.get("type")
@@ -128,11 +248,49 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith(ARGON2_HASH_PREFIX):
+        try:
+            return _argon2_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        return False
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt.
+    """Hash a password using the configured algorithm.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password string
+    """
+    if settings.PASSWORD_HASH_ALGORITHM == "argon2id":
+        return _argon2_hasher.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_COST)).decode()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop.
     
     Args:
         password: Plain text password
@@ -140,7 +298,8 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
 
 
 def generate_password_reset_token(email: str) -> str:
@@ -186,7 +345,7 @@ def create_csrf_token() -> str:
     Returns:
         Random CSRF token
     """
-    return secrets.token_urlsafe(32)
+    return secrets.token_urlsafe(CSRF_TOKEN_BYTES)
 
 
 def validate_csrf_token(token: str, stored_token: str) -> bool:
@@ -199,4 +358,9 @@ def validate_csrf_token(token: str, stored_token: str) -> bool:
     Returns:
         True if tokens match, False otherwise
     """
-    return secrets.compare_digest(token, stored_token)
\ No newline at end of file
+    # Tokens are fixed length, so a length mismatch reveals nothing secret and
+    # skips the comparison. Comparing bytes also keeps non-ASCII input from
+    # raising TypeError in compare_digest.
+    if len(token) != CSRF_TOKEN_LENGTH or len(stored_token) != CSRF_TOKEN_LENGTH:
+        return False
+    return secrets.compare_digest(token.encode(), stored_token.encode())
\ No newline at end of file
@@ -2,27 +2,61 @@
 
 from __future__ import annotations
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from redis.exceptions import RedisError
 
 from app.api.routes import router as api_router
+from app.core.cache import cache
 from app.core.config import settings
+from app.core.database import check_schema_version
+from app.core.security import RequestTokenCacheMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.MIGRATION_MODE == "check":
+        await check_schema_version()
+    try:
+        await cache.connect()
+    except RedisError:
+        if settings.REDIS_REQUIRED:
+            raise
+        logger.warning("Starting without Redis; cache reads will miss until it is reachable")
+    cache.assert_connected()
+    try:
+        yield
+    finally:
+        await cache.disconnect()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.DESCRIPTION,
     version=settings.VERSION,
+    lifespan=lifespan,
 )
 
 if settings.ALLOWED_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.ALLOWED_ORIGINS,
+        # pydantic v2 URLs render with a trailing slash that browsers never send
+        allow_origins=[str(origin).rstrip("/") for origin in settings.ALLOWED_ORIGINS],
         allow_credentials=True,
         allow_methods=settings.ALLOWED_METHODS,
         allow_headers=settings.ALLOWED_HEADERS,
     )
 
+
+app.add_middleware(RequestTokenCacheMiddleware)
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
@@ -4,7 +4,18 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -49,16 +60,41 @@ class AuditLevel(str, Enum):
     CRITICAL = "critical"
 
 
+SECURITY_ACTIONS = frozenset({
+    AuditAction.LOGIN,
+    AuditAction.LOGOUT,
+    AuditAction.REGISTER,
+    AuditAction.PASSWORD_CHANGE,
+    AuditAction.EMAIL_VERIFY,
+    AuditAction.USER_SUSPEND,
+    AuditAction.USER_ACTIVATE,
+})
+
+ERROR_LEVELS = frozenset({AuditLevel.ERROR, AuditLevel.CRITICAL})
+
+
 class AuditLog(BaseModel):
     """Audit log model for tracking system events and user actions."""
     
     __tablename__ = "audit_logs"
+    # Composite indexes matching the audit queries (per user, per action, per
+    # resource) instead of one B-tree per column, to keep inserts cheap.
+    __table_args__ = (
+        Index("ix_audit_logs_user_id_created_at", "user_id", text("created_at DESC")),
+        Index("ix_audit_logs_action_created_at", "action", text("created_at DESC")),
+        Index(
+            "ix_audit_logs_resource",
+            "resource_type",
+            "resource_id",
+            postgresql_where=text("resource_id IS NOT NULL"),
+        ),
+        Index("ix_audit_logs_metadata_gin", "metadata", postgresql_using="gin"),
+    )
     
     # Action details
     action = Column(
         SQLEnum(AuditAction),
         nullable=False,
-        index=True,
         doc="Type of action performed"
     )
     
@@ -66,7 +102,6 @@ class AuditLog(BaseModel):
         SQLEnum(AuditLevel),
         default=AuditLevel.INFO,
         nullable=False,
-        index=True,
         doc="Log level"
     )
     
@@ -99,7 +134,6 @@ class AuditLog(BaseModel):
     request_id = Column(
         String(100),
         nullable=True,
-        index=True,
         doc="Unique request identifier"
     )
     
@@ -107,20 +141,20 @@ class AuditLog(BaseModel):
     resource_type = Column(
         String(50),
         nullable=True,
-        index=True,
         doc="Type of resource affected (user, idea, dossier)"
     )
     
     resource_id = Column(
         Integer,
         nullable=True,
-        index=True,
         doc="ID of the affected resource"
     )
     
     # Metadata
-    metadata = Column(
-        JSON,
+    # "metadata" is reserved by the declarative base; keep the column name
+    extra_metadata = Column(
+        "metadata",
+        JSONB,
         default=dict,
         nullable=False,
         doc="Additional metadata as JSON"
@@ -138,7 +172,6 @@ class AuditLog(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         doc="ID of the user who performed the action"
     )
     
@@ -195,28 +228,19 @@ class AuditLog(BaseModel):
             resource_type=resource_type,
             resource_id=resource_id,
             user_id=user_id,
-            metadata=metadata or {},
+            extra_metadata=metadata or {},
             duration_ms=duration_ms,
         )
     
     @property
     def is_error(self) -> bool:
         """Check if this is an error-level log."""
-        return self.level in [AuditLevel.ERROR, AuditLevel.CRITICAL]
+        return self.level in ERROR_LEVELS
     
     @property
     def is_security_related(self) -> bool:
         """Check if this log is security-related."""
-        security_actions = {
-            AuditAction.LOGIN,
-            AuditAction.LOGOUT,
-            AuditAction.REGISTER,
-            AuditAction.PASSWORD_CHANGE,
-            AuditAction.EMAIL_VERIFY,
-            AuditAction.USER_SUSPEND,
-            AuditAction.USER_ACTIVATE,
-        }
-        return self.action in security_actions
+        return self.action in SECURITY_ACTIONS
     
     def add_metadata(self, key: str, value: any) -> None:
         """Add metadata to the log entry.
@@ -225,9 +249,9 @@ class AuditLog(BaseModel):
             key: Metadata key
             value: Metadata value
         """
-        if self.metadata is None:
-            self.metadata = {}
-        self.metadata[key] = value
+        # Reassign rather than mutate: the JSONB column does not track in-place
+        # changes, so the new key would never be flushed
+        self.extra_metadata = {**(self.extra_metadata or {}), key: value}
     
     def __repr__(self) -> str:
         """String representation of audit log."""
@@ -1,7 +1,9 @@
 """Base model class with common fields and utilities."""
 
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable
 
 from sqlalchemy import Column, DateTime, Integer
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
@@ -52,16 +54,60 @@ class BaseModel(Base, TimestampMixin):
         doc="Primary key identifier"
     )
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _column_names(cls) -> tuple[str, ...]:
+        """Mapped column attribute names, computed once per class.
+        
+        Uses attribute keys rather than table column names, which differ for
+        columns such as ``extra_metadata`` stored as ``metadata``. Deferred and
+        server-computed columns (e.g. search vectors) are skipped so that
+        ``to_dict`` never triggers a lazy load.
+        """
+        return tuple(
+            attr.key
+            for attr in cls.__mapper__.column_attrs
+            if not attr.deferred and all(column.computed is None for column in attr.columns)
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _valid_keys(cls) -> frozenset[str]:
+        """Attribute names as a set for membership checks in from_dict."""
+        return frozenset(cls._column_names())
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _column_getter(cls) -> Callable[[Any], tuple]:
+        """Getter returning every column value of an instance as a tuple."""
+        names = cls._column_names()
+        getter = attrgetter(*names)
+        if len(names) == 1:
+            return lambda obj: (getter(obj),)
+        return getter
+    
     def to_dict(self) -> dict:
         """Convert model instance to dictionary.
         
         Returns:
             Dictionary representation of the model
         """
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        cls = type(self)
+        return dict(zip(cls._column_names(), cls._column_getter()(self)))
+    
+    @classmethod
+    def rows_to_dicts(cls, rows: Iterable["BaseModel"]) -> list[dict]:
+        """Convert many instances of this model to dictionaries.
+        
+        Args:
+            rows: Model instances
+            
+        Returns:
+            List of dictionary representations
+        """
+        names = cls._column_names()
+        getter = cls._column_getter()
+        return [dict(zip(names, getter(row))) for row in rows]
     
     def update(self, **kwargs) -> None:
         """Update model attributes.
@@ -84,7 +130,7 @@ class BaseModel(Base, TimestampMixin):
             Model instance
         """
         # Filter out keys that don't exist as columns
-        valid_keys = {column.name for column in cls.__table__.columns}
+        valid_keys = cls._valid_keys()
         filtered_data = {k: v for k, v in data.items() if k in valid_keys}
         return cls(**filtered_data)
     
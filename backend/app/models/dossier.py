@@ -1,9 +1,13 @@
 """Dossier model for generated startup artifacts."""
 
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
-from sqlalchemy import Column, Enum as SQLEnum, ForeignKey, Integer, JSON, String, Text
+import orjson
+from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -25,6 +29,34 @@ class DossierType(str, Enum):
     ENTERPRISE = "enterprise"
 
 
+# Artifact type accepted by update_artifact/get_artifact -> column attribute
+ARTIFACT_ATTRIBUTES = {
+    "prd": "prd_content",
+    "runbook": "runbook_content",
+    "repo": "repo_structure",
+    "api": "api_sketch",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class DossierExport:
+    """Typed export record for a dossier, serialized directly by orjson."""
+    
+    id: str
+    title: str
+    created_at: datetime
+    idea_text: str
+    one_liner: str
+    scores: dict
+    prd: str
+    runbook: str
+    repo: str
+    api: str
+    wireframes: dict
+    version: int
+    type: DossierType
+
+
 class Dossier(BaseModel):
     """Dossier model for generated startup artifacts."""
     
@@ -78,7 +110,7 @@ class Dossier(BaseModel):
     )
     
     wireframes = Column(
-        JSON,
+        JSONB,
         default=dict,
         nullable=False,
         doc="Generated wireframe data as JSON"
@@ -86,14 +118,14 @@ class Dossier(BaseModel):
     
     # Generation metadata
     generation_config = Column(
-        JSON,
+        JSONB,
         default=dict,
         nullable=False,
         doc="Configuration used for generation"
     )
     
     generation_metrics = Column(
-        JSON,
+        JSONB,
         default=dict,
         nullable=False,
         doc="Metrics from generation process (time, tokens, etc.)"
@@ -127,8 +159,10 @@ class Dossier(BaseModel):
         doc="Dossier version number"
     )
     
-    metadata = Column(
-        JSON,
+    # "metadata" is reserved by the declarative base; keep the column name
+    extra_metadata = Column(
+        "metadata",
+        JSONB,
         default=dict,
         nullable=False,
         doc="Additional metadata as JSON"
@@ -191,16 +225,14 @@ class Dossier(BaseModel):
         elif self.status == DossierStatus.PENDING:
             return 0
         
-        # Calculate based on completed artifacts
-        artifacts = [
-            self.prd_content,
-            self.runbook_content,
-            self.repo_structure,
-            self.api_sketch,
-        ]
-        
-        completed = sum(1 for artifact in artifacts if artifact)
-        return int((completed / len(artifacts)) * 100)
+        # Each of the four artifacts contributes 25%
+        completed = (
+            bool(self.prd_content)
+            + bool(self.runbook_content)
+            + bool(self.repo_structure)
+            + bool(self.api_sketch)
+        )
+        return completed * 25
     
     def mark_as_processing(self) -> None:
         """Mark dossier as processing."""
@@ -232,14 +264,9 @@ class Dossier(BaseModel):
             artifact_type: Type of artifact (prd, runbook, repo, api)
             content: Artifact content
         """
-        if artifact_type == "prd":
-            self.prd_content = content
-        elif artifact_type == "runbook":
-            self.runbook_content = content
-        elif artifact_type == "repo":
-            self.repo_structure = content
-        elif artifact_type == "api":
-            self.api_sketch = content
+        attribute = ARTIFACT_ATTRIBUTES.get(artifact_type)
+        if attribute is not None:
+            setattr(self, attribute, content)
     
     def get_artifact(self, artifact_type: str) -> Optional[str]:
         """Get a specific artifact.
@@ -250,15 +277,10 @@ class Dossier(BaseModel):
         Returns:
             Artifact content or None
         """
-        if artifact_type == "prd":
-            return self.prd_content
-        elif artifact_type == "runbook":
-            return self.runbook_content
-        elif artifact_type == "repo":
-            return self.repo_structure
-        elif artifact_type == "api":
-            return self.api_sketch
-        return None
+        attribute = ARTIFACT_ATTRIBUTES.get(artifact_type)
+        if attribute is None:
+            return None
+        return getattr(self, attribute)
     
     def increment_version(self) -> None:
         """Increment dossier version."""
@@ -286,6 +308,44 @@ class Dossier(BaseModel):
             "type": self.type,
         }
     
+    def to_export_struct(self) -> DossierExport:
+        """Build the typed export record for this dossier.
+        
+        Callers exporting many dossiers should eager-load ``Dossier.idea``
+        (e.g. with ``selectinload``) to avoid one lazy load per row.
+        
+        Returns:
+            Export record for orjson serialization
+        """
+        idea = self.idea
+        return DossierExport(
+            id=str(self.id),
+            title=self.title,
+            created_at=self.created_at,
+            idea_text=idea.description if idea else "",
+            one_liner=idea.one_liner if idea else "",
+            scores=idea.score_breakdown if idea else {},
+            prd=self.prd_content or "",
+            runbook=self.runbook_content or "",
+            repo=self.repo_structure or "",
+            api=self.api_sketch or "",
+            wireframes=self.wireframes,
+            version=self.version,
+            type=self.type,
+        )
+    
+    @staticmethod
+    def export_json(dossiers: Iterable["Dossier"]) -> bytes:
+        """Serialize dossiers for export without intermediate dicts.
+        
+        Args:
+            dossiers: Dossiers to export
+            
+        Returns:
+            JSON array of export records as bytes
+        """
+        return orjson.dumps([dossier.to_export_struct() for dossier in dossiers])
+    
     def __repr__(self) -> str:
         """String representation of dossier."""
         return f"<Dossier(id={self.id}, title='{self.title[:30]}...', status='{self.status}')>"
\ No newline at end of file
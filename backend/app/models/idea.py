@@ -3,8 +3,9 @@
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import Column, Enum as SQLEnum, ForeignKey, Integer, JSON, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Enum as SQLEnum, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
 
@@ -35,44 +36,61 @@ class Idea(BaseModel):
     """Idea model for storing startup concepts."""
     
     __tablename__ = "ideas"
+    __table_args__ = (
+        Index("ix_ideas_owner_id_created_at", "owner_id", text("created_at DESC")),
+        # Trigram index so lower(title) LIKE '%term%' search avoids a seq scan
+        Index(
+            "ix_ideas_title_trgm",
+            func.lower(text("title")).label("title_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"title_lower": "gin_trgm_ops"},
+        ),
+        # Tag filters are containment queries: Idea.tags.contains([tag])
+        Index(
+            "ix_ideas_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+    )
     
     # Basic idea information
-    title = Column(
+    title: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
         index=True,
         doc="Idea title or name"
     )
     
-    one_liner = Column(
+    one_liner: Mapped[str] = mapped_column(
         String(500),
         nullable=False,
         doc="Brief one-line description"
     )
     
-    description = Column(
+    description: Mapped[str] = mapped_column(
         Text,
         nullable=False,
         doc="Detailed idea description"
     )
     
     # Categorization
-    category = Column(
+    category: Mapped[IdeaCategory] = mapped_column(
         SQLEnum(IdeaCategory),
         default=IdeaCategory.OTHER,
         nullable=False,
         doc="Idea category"
     )
     
-    tags = Column(
-        JSON,
+    tags: Mapped[list[str]] = mapped_column(
+        JSONB,
         default=list,
         nullable=False,
         doc="List of tags for categorization"
     )
     
     # Status and visibility
-    status = Column(
+    status: Mapped[IdeaStatus] = mapped_column(
         SQLEnum(IdeaStatus),
         default=IdeaStatus.DRAFT,
         nullable=False,
@@ -80,42 +98,42 @@ class Idea(BaseModel):
     )
     
     # Scoring (from frontend algorithm)
-    total_score = Column(
+    total_score: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
         doc="Total idea score (0-100)"
     )
     
-    desirability_score = Column(
+    desirability_score: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
         doc="Desirability score (0-20)"
     )
     
-    feasibility_score = Column(
+    feasibility_score: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
         doc="Feasibility score (0-20)"
     )
     
-    viability_score = Column(
+    viability_score: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
         doc="Viability score (0-20)"
     )
     
-    defensibility_score = Column(
+    defensibility_score: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
         doc="Defensibility score (0-20)"
     )
     
-    timing_score = Column(
+    timing_score: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
@@ -123,7 +141,7 @@ class Idea(BaseModel):
     )
     
     # Version control
-    version = Column(
+    version: Mapped[int] = mapped_column(
         Integer,
         default=1,
         nullable=False,
@@ -131,15 +149,17 @@ class Idea(BaseModel):
     )
     
     # Metadata
-    metadata = Column(
-        JSON,
+    # "metadata" is reserved by the declarative base; keep the column name
+    extra_metadata: Mapped[dict] = mapped_column(
+        "metadata",
+        JSONB,
         default=dict,
         nullable=False,
         doc="Additional metadata as JSON"
     )
     
     # Foreign keys
-    owner_id = Column(
+    owner_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
@@ -147,13 +167,13 @@ class Idea(BaseModel):
     )
     
     # Relationships
-    owner = relationship(
+    owner: Mapped["User"] = relationship(
         "User",
         back_populates="ideas",
         doc="User who owns this idea"
     )
     
-    dossiers = relationship(
+    dossiers: Mapped[list["Dossier"]] = relationship(
         "Dossier",
         back_populates="idea",
         cascade="all, delete-orphan",
@@ -195,10 +215,10 @@ class Idea(BaseModel):
         Args:
             tag: Tag to add
         """
-        if self.tags is None:
-            self.tags = []
-        if tag not in self.tags:
-            self.tags.append(tag)
+        # Assign a new list; in-place changes to a JSONB value are not tracked
+        tags = self.tags or []
+        if tag not in tags:
+            self.tags = [*tags, tag]
     
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the idea.
@@ -207,7 +227,7 @@ class Idea(BaseModel):
             tag: Tag to remove
         """
         if self.tags and tag in self.tags:
-            self.tags.remove(tag)
+            self.tags = [existing for existing in self.tags if existing != tag]
     
     def archive(self) -> None:
         """Archive the idea."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime, timezone
 from enum import Enum
 
 from sqlalchemy import (
@@ -10,15 +11,18 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum as SQLEnum,
+    FetchedValue,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, relationship
 from sqlalchemy.sql import func
 
 from app.models.base import BaseModel
@@ -61,6 +65,22 @@ class Workspace(BaseModel):
     """Tenant-style container for Launchloom runs and members."""
 
     __tablename__ = "workspaces"
+    __table_args__ = (
+        Index("ix_workspaces_created_at_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_workspaces_settings_gin",
+            "settings",
+            postgresql_using="gin",
+            postgresql_ops={"settings": "jsonb_path_ops"},
+        ),
+        # Trigram index so lower(name) LIKE '%term%' search avoids a seq scan
+        Index(
+            "ix_workspaces_name_trgm",
+            func.lower(text("name")).label("name_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"name_lower": "gin_trgm_ops"},
+        ),
+    )
 
     public_id = Column(
         String(36),
@@ -91,6 +111,7 @@ class Workspace(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
         doc="User who created the workspace",
     )
     settings = Column(
@@ -189,6 +210,7 @@ class WorkspaceMember(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
         doc="User who issued the invitation",
     )
 
@@ -196,7 +218,8 @@ class WorkspaceMember(BaseModel):
 
     def accept(self) -> None:
         self.status = MembershipStatus.ACTIVE
-        self.joined_at = func.now()
+        # A real datetime, so the attribute stays readable before the flush
+        self.joined_at = datetime.now(timezone.utc)
 
     def suspend(self) -> None:
         self.status = MembershipStatus.SUSPENDED
@@ -211,19 +234,54 @@ class WorkspaceRun(BaseModel):
     __tablename__ = "workspace_runs"
     __table_args__ = (
         UniqueConstraint("workspace_id", "run_id", name="uq_workspace_run_id"),
+        # Matches list_workspace_runs' ORDER BY so pages are read in index
+        # order; also serves as the workspace_id foreign key index.
+        Index(
+            "ix_workspace_runs_workspace_id_created_at_id",
+            "workspace_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Runs needing attention (review/fail) are a small slice of the table
+        Index(
+            "ix_workspace_runs_attention",
+            "workspace_id",
+            text("created_at DESC"),
+            postgresql_where=text("compliance_status <> 'pass'"),
+        ),
+        Index("ix_workspace_runs_workspace_id_compliance_status", "workspace_id", "compliance_status"),
+        Index(
+            "ix_workspace_runs_telemetry_gin",
+            "telemetry",
+            postgresql_using="gin",
+            postgresql_ops={"telemetry": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_workspace_runs_stage_metrics_gin",
+            "stage_metrics",
+            postgresql_using="gin",
+            postgresql_ops={"stage_metrics": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_workspace_runs_pipeline_config_gin",
+            "pipeline_config",
+            postgresql_using="gin",
+            postgresql_ops={"pipeline_config": "jsonb_path_ops"},
+        ),
+        Index("ix_workspace_runs_idea_text_tsv", "idea_text_tsv", postgresql_using="gin"),
     )
 
     workspace_id = Column(
         Integer,
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="Workspace associated with this run",
     )
     triggered_by_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
         doc="User that triggered the pipeline",
     )
     run_id = Column(
@@ -260,6 +318,17 @@ class WorkspaceRun(BaseModel):
         nullable=False,
         doc="Full idea prompt or description",
     )
+    # Maintained by a database trigger; deferred so loading a run never pulls
+    # the vector
+    idea_text_tsv = deferred(
+        Column(
+            TSVECTOR,
+            server_default=FetchedValue(),
+            server_onupdate=FetchedValue(),
+            nullable=True,
+            doc="Full-text search vector over the idea title and text",
+        )
+    )
     compliance_status = Column(
         SQLEnum(ComplianceStatus),
         nullable=False,
@@ -69,7 +69,9 @@ class WorkspaceRead(WorkspaceBase):
 
 class WorkspaceListResponse(BaseModel):
     items: list[WorkspaceRead]
-    total: int
+    total: Optional[int] = Field(None, description="Exact number of workspaces; only set when exact_count=true")
+    estimated_total: Optional[int] = Field(None, description="Planner estimate of the number of workspaces")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page; null on the last page")
 
 
 class WorkspaceRunBase(BaseModel):
@@ -106,7 +108,8 @@ class WorkspaceRunRead(WorkspaceRunBase):
 
 class WorkspaceRunListResponse(BaseModel):
     items: list[WorkspaceRunRead]
-    total: int
+    total: Optional[int] = Field(None, description="Number of runs in the workspace; null on keyset pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page; null on the last page")
 
 
 class WorkspaceWithRuns(WorkspaceRead):
@@ -0,0 +1,63 @@
+"""Audit log persistence helpers."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audit import AuditAction, AuditLevel, AuditLog
+
+
+class AuditLogBuffer:
+    """Collects audit rows for one request and inserts them in a single statement."""
+
+    def __init__(self) -> None:
+        self._rows: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(
+        self,
+        action: AuditAction,
+        description: str,
+        user_id: Optional[int] = None,
+        level: AuditLevel = AuditLevel.INFO,
+        details: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        request_id: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[int] = None,
+        metadata: Optional[dict] = None,
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        # Every row carries the same keys so the insert stays one executemany batch
+        self._rows.append(
+            {
+                "action": action,
+                "level": level,
+                "description": description,
+                "details": details,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "request_id": request_id,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "user_id": user_id,
+                "extra_metadata": metadata or {},
+                "duration_ms": duration_ms,
+            }
+        )
+
+    async def flush(self, db: AsyncSession) -> int:
+        # Commits db, so pass a session of its own rather than a route's session
+        if not self._rows:
+            return 0
+        rows, self._rows = self._rows, []
+        # ORM bulk INSERT: no unit of work, identity map or per-row flush
+        await db.execute(insert(AuditLog), rows)
+        await db.commit()
+        return len(rows)
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import re
+from datetime import datetime
 from typing import Iterable, Optional
 
 from slugify import slugify
-from sqlalchemy import func, select
+from sqlalchemy import Integer, Row, case, func, insert, lambda_stmt, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.workspace import (
     MembershipStatus,
@@ -21,24 +27,115 @@ from app.schemas.workspace import (
     WorkspaceCreate,
     WorkspaceMemberCreate,
     WorkspaceRunCreate,
+    WorkspaceRunRead,
 )
 
+# Shape of Workspace.public_id (str(uuid4())); anything else is treated as a slug.
+PUBLIC_ID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+RUN_LIST_COLUMNS = tuple(getattr(WorkspaceRun, name) for name in WorkspaceRunRead.model_fields)
+
 
 class WorkspaceAlreadyExistsError(ValueError):
     """Raised when attempting to create a workspace with a duplicate slug."""
 
 
-async def _generate_unique_slug(db: AsyncSession, name: str) -> str:
-    base_slug = slugify(name) or "workspace"
-    slug_candidate = base_slug
-    counter = 1
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def _next_cursor(rows: list, limit: int) -> Optional[str]:
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last.created_at, last.id)
 
-    while True:
-        result = await db.execute(select(Workspace.id).where(Workspace.slug == slug_candidate))
-        if result.scalar_one_or_none() is None:
-            return slug_candidate
-        counter += 1
-        slug_candidate = f"{base_slug}-{counter}"
+
+async def estimate_row_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """Return the planner's row estimate for a table instead of running COUNT(*).
+
+    None when Postgres has no estimate yet: reltuples is -1 until the table has
+    been vacuumed or analyzed.
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name},
+    )
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+async def count_workspaces(db: AsyncSession) -> int:
+    result = await db.execute(select(func.count()).select_from(Workspace))
+    return result.scalar_one()
+
+
+def _base_slug(name: str) -> str:
+    return slugify(name) or "workspace"
+
+
+async def _last_slug_suffixes(db: AsyncSession, base_slugs: list[str]) -> dict[str, int]:
+    # Highest -N suffix already taken for each base (1 when only the bare slug
+    # exists). slugify output is [a-z0-9-] only, so it is safe inside the regex.
+    result = await db.execute(
+        text(
+            "SELECT b.base, COALESCE(MAX(CAST(substring(w.slug FROM '-([0-9]{1,9})$') AS integer)), 1) "
+            "FROM unnest(CAST(:bases AS text[])) AS b(base) "
+            "LEFT JOIN workspaces w ON w.slug ~ ('^' || b.base || '-[0-9]{1,9}$') "
+            "GROUP BY b.base"
+        ),
+        {"bases": base_slugs},
+    )
+    return {base: last for base, last in result}
+
+
+async def _next_slug_suffix(db: AsyncSession, base_slug: str) -> int:
+    return (await _last_slug_suffixes(db, [base_slug]))[base_slug] + 1
+
+
+def _workspace_values(payload: WorkspaceCreate) -> dict:
+    return {
+        "name": payload.name,
+        "description": payload.description,
+        "settings": payload.settings,
+        "is_active": payload.is_active,
+        "created_by_id": payload.created_by_id,
+    }
+
+
+async def _insert_workspace(db: AsyncSession, values: dict, slug: str) -> Optional[Workspace]:
+    result = await db.execute(
+        pg_insert(Workspace)
+        .values(slug=slug, **values)
+        .on_conflict_do_nothing(index_elements=[Workspace.slug])
+        .returning(Workspace)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _insert_workspaces(db: AsyncSession, rows: list[dict]) -> dict[str, Workspace]:
+    result = await db.execute(
+        pg_insert(Workspace)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Workspace.slug])
+        .returning(Workspace)
+    )
+    return {workspace.slug: workspace for workspace in result.scalars()}
 
 
 async def create_workspace(
@@ -46,70 +143,203 @@ async def create_workspace(
     payload: WorkspaceCreate,
     members: Optional[Iterable[WorkspaceMemberCreate]] = None,
 ) -> Workspace:
-    slug = payload.slug or await _generate_unique_slug(db, payload.name)
-    workspace = Workspace(
-        name=payload.name,
-        slug=slug,
-        description=payload.description,
-        settings=payload.settings,
-        is_active=payload.is_active,
-        created_by_id=payload.created_by_id,
-    )
+    values = _workspace_values(payload)
 
-    if members:
-        for member in members:
-            workspace.members.append(
-                WorkspaceMember(
-                    email=member.email,
-                    role=member.role,
-                    status=MembershipStatus.ACTIVE if member.role == WorkspaceRole.OWNER else MembershipStatus.INVITED,
-                )
-            )
-
-    db.add(workspace)
     try:
+        if payload.slug:
+            workspace = await _insert_workspace(db, values, payload.slug)
+        else:
+            # Try the bare slug first; only on conflict look up the next free suffix
+            base_slug = _base_slug(payload.name)
+            workspace = await _insert_workspace(db, values, base_slug)
+            if workspace is None:
+                suffix = await _next_slug_suffix(db, base_slug)
+                workspace = await _insert_workspace(db, values, f"{base_slug}-{suffix}")
+        if workspace is None:
+            await db.rollback()
+            raise WorkspaceAlreadyExistsError(payload.slug or payload.name)
+
+        member_rows = [
+            {
+                "workspace_id": workspace.id,
+                "email": member.email,
+                "role": member.role,
+                "status": MembershipStatus.ACTIVE if member.role == WorkspaceRole.OWNER else MembershipStatus.INVITED,
+            }
+            for member in members or ()
+        ]
+        created_members = []
+        if member_rows:
+            # One multi-row INSERT instead of a unit-of-work flush per member
+            result = await db.execute(insert(WorkspaceMember).returning(WorkspaceMember), member_rows)
+            created_members = list(result.scalars().all())
         await db.commit()
     except IntegrityError as exc:
         await db.rollback()
         raise WorkspaceAlreadyExistsError(str(exc)) from exc
 
-    await db.refresh(workspace, attribute_names=["members"])
+    # A new workspace has exactly the members just inserted; set the collection
+    # directly rather than reloading it
+    set_committed_value(workspace, "members", created_members)
     return workspace
 
 
+async def bulk_create_workspaces(db: AsyncSession, payloads: list[WorkspaceCreate]) -> list[Workspace]:
+    if not payloads:
+        return []
+    rows = [{**_workspace_values(payload), "slug": payload.slug or _base_slug(payload.name)} for payload in payloads]
+
+    try:
+        # Pass 1: every distinct slug in one multi-row INSERT ... ON CONFLICT.
+        # Later rows repeating a slug from this batch go straight to pass 2.
+        first_index: dict[str, int] = {}
+        for index, row in enumerate(rows):
+            first_index.setdefault(row["slug"], index)
+        created = await _insert_workspaces(db, [rows[index] for index in first_index.values()])
+        results: dict[int, Workspace] = {
+            index: created[slug] for slug, index in first_index.items() if slug in created
+        }
+
+        pending = [index for index in range(len(rows)) if index not in results]
+        taken = [payloads[index].slug for index in pending if payloads[index].slug]
+        if taken:
+            await db.rollback()
+            raise WorkspaceAlreadyExistsError(", ".join(taken))
+
+        if pending:
+            # Pass 2: one query for the last suffix per base slug, then number
+            # the remaining rows after it and insert them together.
+            last_suffixes = await _last_slug_suffixes(db, sorted({rows[index]["slug"] for index in pending}))
+            for index in pending:
+                base_slug = rows[index]["slug"]
+                last_suffixes[base_slug] += 1
+                rows[index]["slug"] = f"{base_slug}-{last_suffixes[base_slug]}"
+            created = await _insert_workspaces(db, [rows[index] for index in pending])
+            lost = [rows[index]["slug"] for index in pending if rows[index]["slug"] not in created]
+            if lost:
+                # Another writer took a numbered slug between the two passes
+                await db.rollback()
+                raise WorkspaceAlreadyExistsError(", ".join(lost))
+            results.update((index, created[rows[index]["slug"]]) for index in pending)
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise WorkspaceAlreadyExistsError(str(exc)) from exc
+
+    # Returned in input order regardless of which pass created each row
+    workspaces = [results[index] for index in range(len(rows))]
+    for workspace in workspaces:
+        set_committed_value(workspace, "members", [])
+    return workspaces
+
+
 async def list_workspaces(
     db: AsyncSession,
     *,
     limit: int = 50,
     offset: int = 0,
-) -> tuple[list[Workspace], int]:
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> tuple[list[Workspace], Optional[str]]:
     query = (
         select(Workspace)
-        .options(selectinload(Workspace.members))
-        .order_by(Workspace.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .options(selectinload(Workspace.members), raiseload("*"))
+        .order_by(Workspace.created_at.desc(), Workspace.id.desc())
+        .limit(limit + 1)
     )
+    if cursor is not None:
+        query = query.where(tuple_(Workspace.created_at, Workspace.id) < tuple_(*cursor))
+    else:
+        query = query.offset(offset)
     result = await db.execute(query)
-    workspaces = result.scalars().unique().all()
+    workspaces = list(result.scalars().all())
+    return workspaces[:limit], _next_cursor(workspaces, limit)
+
 
-    total_result = await db.execute(select(func.count()).select_from(Workspace))
-    total = int(total_result.scalar_one())
-    return workspaces, total
+# The hot lookups below are lambda statements: SQLAlchemy caches each one by
+# the lambda's code location, so repeat calls skip rebuilding the expression
+# tree and its cache key and only rebind the closure values.
 
 
 async def get_workspace_by_public_id(db: AsyncSession, public_id: str) -> Optional[Workspace]:
     result = await db.execute(
-        select(Workspace)
-        .options(selectinload(Workspace.members), selectinload(Workspace.runs))
-        .where(Workspace.public_id == public_id)
+        lambda_stmt(
+            lambda: select(Workspace)
+            .options(selectinload(Workspace.members), selectinload(Workspace.runs), raiseload("*"))
+            .where(Workspace.public_id == public_id)
+        )
     )
-    return result.scalars().unique().one_or_none()
+    return result.scalar_one_or_none()
 
 
 async def get_workspace_by_slug(db: AsyncSession, slug: str) -> Optional[Workspace]:
-    result = await db.execute(select(Workspace).where(Workspace.slug == slug))
-    return result.scalars().unique().one_or_none()
+    result = await db.execute(
+        lambda_stmt(lambda: select(Workspace).options(raiseload("*")).where(Workspace.slug == slug))
+    )
+    return result.scalar_one_or_none()
+
+
+def _workspace_identifier_columns(identifier: str) -> tuple:
+    # One equality on a unique index instead of an OR across public_id and slug.
+    # A UUID-shaped identifier may still be a slug, so callers fall back to the
+    # slug column when the public_id lookup misses.
+    if PUBLIC_ID_PATTERN.match(identifier):
+        return (Workspace.public_id, Workspace.slug)
+    return (Workspace.slug,)
+
+
+async def load_workspace(
+    db: AsyncSession,
+    identifier: str,
+    *,
+    with_members: bool = False,
+    with_runs: bool = False,
+) -> Optional[Workspace]:
+    for column in _workspace_identifier_columns(identifier):
+        stmt = lambda_stmt(lambda: select(Workspace).where(column == identifier))
+        if with_members:
+            stmt += lambda s: s.options(selectinload(Workspace.members))
+        if with_runs:
+            stmt += lambda s: s.options(selectinload(Workspace.runs))
+        # Relationships not requested raise on access instead of lazy-loading, so
+        # a missing eager load shows up as an error rather than an extra query
+        stmt += lambda s: s.options(raiseload("*"))
+        result = await db.execute(stmt)
+        workspace = result.scalars().one_or_none()
+        if workspace is not None:
+            return workspace
+    return None
+
+
+async def get_workspace_with_recent_runs(
+    db: AsyncSession,
+    identifier: str,
+    *,
+    run_limit: int = 10,
+) -> Optional[Workspace]:
+    for column in _workspace_identifier_columns(identifier):
+        identifier_match = column == identifier
+        recent_run_ids = (
+            select(WorkspaceRun.id)
+            .join(WorkspaceRun.workspace)
+            .where(identifier_match)
+            .order_by(WorkspaceRun.created_at.desc())
+            .limit(run_limit)
+        )
+        result = await db.execute(
+            select(Workspace)
+            .options(
+                selectinload(Workspace.members),
+                selectinload(Workspace.runs.and_(WorkspaceRun.id.in_(recent_run_ids))),
+                raiseload("*"),
+            )
+            .where(identifier_match)
+            # Replace an already-loaded runs collection with the recent slice
+            .execution_options(populate_existing=True)
+        )
+        workspace = result.scalars().one_or_none()
+        if workspace is not None:
+            return workspace
+    return None
 
 
 async def get_workspace_run_by_public_ids(
@@ -118,15 +348,18 @@ async def get_workspace_run_by_public_ids(
     workspace_public_id: str,
     run_id: str,
 ) -> Optional[WorkspaceRun]:
-    result = await db.execute(
-        select(WorkspaceRun)
-        .join(WorkspaceRun.workspace)
-        .where(
-            WorkspaceRun.run_id == run_id,
-            (Workspace.public_id == workspace_public_id) | (Workspace.slug == workspace_public_id),
+    for column in _workspace_identifier_columns(workspace_public_id):
+        result = await db.execute(
+            lambda_stmt(
+                lambda: select(WorkspaceRun)
+                .join(WorkspaceRun.workspace)
+                .where(WorkspaceRun.run_id == run_id, column == workspace_public_id)
+            )
         )
-    )
-    return result.scalars().one_or_none()
+        run = result.scalars().one_or_none()
+        if run is not None:
+            return run
+    return None
 
 
 async def add_workspace_member(
@@ -134,22 +367,30 @@ async def add_workspace_member(
     workspace: Workspace,
     member: WorkspaceMemberCreate,
 ) -> WorkspaceMember:
-    existing = next((m for m in workspace.members if m.email == member.email), None)
-    if existing:
-        existing.role = member.role
-        if existing.status == MembershipStatus.INVITED and member.role != WorkspaceRole.VIEWER:
-            existing.status = MembershipStatus.ACTIVE
-        return existing
-
-    workspace_member = WorkspaceMember(
+    # Single upsert against uq_workspace_member_email instead of loading the
+    # members collection to look for the email in Python. An invited member
+    # takes the status a new member with this role would get.
+    stmt = pg_insert(WorkspaceMember).values(
         workspace_id=workspace.id,
         email=member.email,
         role=member.role,
         status=MembershipStatus.ACTIVE if member.role != WorkspaceRole.VIEWER else MembershipStatus.INVITED,
     )
-    db.add(workspace_member)
-    await db.flush()
-    return workspace_member
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_workspace_member_email",
+        set_={
+            "role": stmt.excluded.role,
+            "status": case(
+                (WorkspaceMember.status == MembershipStatus.INVITED, stmt.excluded.status),
+                else_=WorkspaceMember.status,
+            ),
+            "updated_at": func.now(),
+        },
+    )
+    result = await db.execute(
+        stmt.returning(WorkspaceMember).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
 
 
 async def create_workspace_run(
@@ -157,7 +398,9 @@ async def create_workspace_run(
     workspace: Workspace,
     payload: WorkspaceRunCreate,
 ) -> WorkspaceRun:
-    run = WorkspaceRun(
+    # RETURNING hands back server defaults (id, timestamps) with the INSERT, so
+    # no refresh SELECT is needed afterwards
+    stmt = insert(WorkspaceRun).values(
         workspace_id=workspace.id,
         run_id=payload.run_id,
         execution_id=payload.execution_id,
@@ -177,14 +420,13 @@ async def create_workspace_run(
         pipeline_config=payload.pipeline_config,
         triggered_by_id=payload.triggered_by_id,
     )
-    db.add(run)
     try:
+        run = (await db.execute(stmt.returning(WorkspaceRun))).scalar_one()
         await db.commit()
     except IntegrityError:
         await db.rollback()
         raise
 
-    await db.refresh(run)
     return run
 
 
@@ -194,19 +436,26 @@ async def list_workspace_runs(
     *,
     limit: int = 50,
     offset: int = 0,
-) -> tuple[list[WorkspaceRun], int]:
+    cursor: Optional[tuple[datetime, int]] = None,
+) -> tuple[list[Row], Optional[str], Optional[int]]:
+    # Read-only listing: plain rows carrying just the response columns, so no
+    # ORM instances or identity-map entries are built per run
     query = (
-        select(WorkspaceRun)
+        select(*RUN_LIST_COLUMNS)
         .where(WorkspaceRun.workspace_id == workspace.id)
-        .order_by(WorkspaceRun.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .order_by(WorkspaceRun.created_at.desc(), WorkspaceRun.id.desc())
+        .limit(limit + 1)
     )
+    if cursor is not None:
+        query = query.where(tuple_(WorkspaceRun.created_at, WorkspaceRun.id) < tuple_(*cursor))
+    else:
+        # The window runs before OFFSET/LIMIT, so every row carries the total
+        # and no separate COUNT round-trip is needed. Keyset pages only see the
+        # rows after the cursor, so they report no total.
+        query = query.add_columns(func.count().over().label("total")).offset(offset)
     result = await db.execute(query)
-    runs = result.scalars().all()
-
-    total_result = await db.execute(
-        select(func.count()).select_from(WorkspaceRun).where(WorkspaceRun.workspace_id == workspace.id)
-    )
-    total = int(total_result.scalar_one())
-    return runs, total
+    runs = list(result.all())
+    total = None
+    if cursor is None:
+        total = runs[0].total if runs else (0 if offset == 0 else None)
+    return runs[:limit], _next_cursor(runs, limit), total
@@ -0,0 +1,14 @@
+"""Shared pytest configuration for the backend test suite."""
+
+import os
+
+# Settings are read once at import time, so the required secrets must be in
+# the environment before any app module is imported.
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key")
+os.environ.setdefault("ENVIRONMENT", "testing")
+os.environ.setdefault("BCRYPT_COST", "4")
+
+# Relationships are declared by class name; every model must be imported before
+# the first instance is created so the mappers can be configured.
+from app.models import audit, dossier, idea, user, workspace  # noqa: E402,F401
@@ -0,0 +1,124 @@
+"""Tests for the request-scoped audit log buffer."""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.api import deps
+from app.models.audit import AuditAction, AuditLevel
+from app.services.audit import AuditLogBuffer
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.executed: list = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, params=None):
+        if self.fail:
+            raise OperationalError("INSERT", {}, Exception("database is down"))
+        self.executed.append((statement, params))
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def audit_sessions(monkeypatch):
+    sessions: list[FakeSession] = []
+
+    def factory(fail: bool = False):
+        def make():
+            session = FakeSession(fail)
+            sessions.append(session)
+            return session
+        monkeypatch.setattr(deps, "AsyncSessionLocal", make)
+        return sessions
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_flush_inserts_all_rows_in_one_statement():
+    buffer = AuditLogBuffer()
+    buffer.add(AuditAction.LOGIN, "Signed in", user_id=1)
+    buffer.add(AuditAction.LOGIN, "Bad password", level=AuditLevel.WARNING, metadata={"attempt": 2})
+    db = FakeSession()
+
+    assert await buffer.flush(db) == 2
+
+    assert len(db.executed) == 1
+    _, rows = db.executed[0]
+    assert [row["description"] for row in rows] == ["Signed in", "Bad password"]
+    assert rows[0]["extra_metadata"] == {}
+    assert rows[1]["extra_metadata"] == {"attempt": 2}
+    # Every row carries the same keys so the insert stays one batch
+    assert rows[0].keys() == rows[1].keys()
+    assert db.committed
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_without_rows_skips_the_database():
+    db = FakeSession()
+
+    assert await AuditLogBuffer().flush(db) == 0
+    assert db.executed == []
+    assert not db.committed
+
+
+@pytest.mark.asyncio
+async def test_dependency_flushes_on_its_own_session(audit_sessions):
+    sessions = audit_sessions()
+    dependency = deps.get_audit_buffer()
+    buffer = await dependency.__anext__()
+    buffer.add(AuditAction.LOGOUT, "Signed out", user_id=1)
+
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert len(sessions) == 1
+    assert len(sessions[0].executed) == 1
+    assert sessions[0].committed
+
+
+@pytest.mark.asyncio
+async def test_dependency_flushes_when_the_route_raises(audit_sessions):
+    sessions = audit_sessions()
+    dependency = deps.get_audit_buffer()
+    buffer = await dependency.__anext__()
+    buffer.add(AuditAction.LOGIN, "Permission denied", level=AuditLevel.WARNING)
+
+    with pytest.raises(PermissionError):
+        await dependency.athrow(PermissionError("forbidden"))
+
+    assert len(sessions[0].executed) == 1
+
+
+@pytest.mark.asyncio
+async def test_dependency_keeps_route_error_when_audit_insert_fails(audit_sessions):
+    audit_sessions(fail=True)
+    dependency = deps.get_audit_buffer()
+    buffer = await dependency.__anext__()
+    buffer.add(AuditAction.LOGIN, "Permission denied")
+
+    with pytest.raises(PermissionError):
+        await dependency.athrow(PermissionError("forbidden"))
+
+
+@pytest.mark.asyncio
+async def test_dependency_without_rows_opens_no_session(audit_sessions):
+    sessions = audit_sessions()
+    dependency = deps.get_audit_buffer()
+    await dependency.__anext__()
+
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert sessions == []
@@ -0,0 +1,26 @@
+"""Tests for the audit log model."""
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.audit import AuditAction, AuditLog
+
+
+def test_add_metadata_marks_loaded_metadata_dirty():
+    log = AuditLog(action=AuditAction.LOGIN, description="Signed in")
+    original = {"ip": "10.0.0.1"}
+    set_committed_value(log, "extra_metadata", original)
+
+    log.add_metadata("attempt", 2)
+
+    assert log.extra_metadata == {"ip": "10.0.0.1", "attempt": 2}
+    assert inspect(log).attrs.extra_metadata.history.has_changes()
+    assert original == {"ip": "10.0.0.1"}
+
+
+def test_add_metadata_starts_from_empty_metadata():
+    log = AuditLog(action=AuditAction.LOGIN, description="Signed in")
+
+    log.add_metadata("attempt", 1)
+
+    assert log.extra_metadata == {"attempt": 1}
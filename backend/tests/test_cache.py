@@ -0,0 +1,226 @@
+"""Tests for the Redis cache manager."""
+
+import asyncio
+from typing import Optional
+
+import orjson
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import CLEAR_BATCH_SIZE, GET_MANY_BATCH_SIZE, CacheManager
+
+
+class FakePipeline:
+    """Queues commands and runs them against the FakeRedis on execute()."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.queued: list = []
+
+    def mget(self, keys):
+        self.queued.append(("mget", list(keys)))
+
+    def unlink(self, key):
+        self.queued.append(("unlink", key))
+
+    async def execute(self):
+        queued, self.queued = self.queued, []
+        self.redis.executes.append([name for name, _ in queued])
+        results = []
+        for name, arg in queued:
+            if name == "mget":
+                results.append([self.redis.data.get(key) for key in arg])
+            else:
+                results.append(int(self.redis.data.pop(arg, None) is not None))
+        return results
+
+
+class FakeScript:
+    """Applies SET_MANY_SCRIPT's effect: ARGV is one value per key, then the TTL."""
+
+    def __init__(self):
+        self.calls: list = []
+
+    async def __call__(self, keys, args, client):
+        self.calls.append((keys, args))
+        ttl = args[-1]
+        for key, value in zip(keys, args):
+            await client.set(key, value, ex=ttl)
+        return len(keys)
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for CacheManager, backed by a dict."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.reads = 0
+        self.read_gate: Optional[asyncio.Event] = None
+        self.mgets: list[list[str]] = []
+        self.executes: list[list[str]] = []
+        self.scan_counts: list[int] = []
+
+    async def get(self, key):
+        value = self.data.get(key)
+        self.reads += 1
+        if self.read_gate is not None:
+            await self.read_gate.wait()
+        return value
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+        return True
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    async def mget(self, keys):
+        self.mgets.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def scan_iter(self, match=None, count=None):
+        self.scan_counts.append(count)
+        prefix = match.rstrip("*")
+        for key in [key for key in self.data if key.startswith(prefix)]:
+            yield key
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    manager = CacheManager("redis://unused")
+    manager.redis = redis
+    manager._set_many_script = FakeScript()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_get_serves_repeat_reads_from_local_cache(cache, redis):
+    await cache.set("k", {"v": 1})
+
+    assert await cache.get("k") == {"v": 1}
+    assert await cache.get("k") == {"v": 1}
+    assert redis.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_write_during_redis_read_is_not_overwritten_locally(cache, redis):
+    await cache.set("k", "old")
+    redis.read_gate = asyncio.Event()
+
+    # get() reads "old" from Redis and is parked before caching it locally
+    reader = asyncio.create_task(cache.get("k"))
+    await asyncio.sleep(0)
+    await cache.set("k", "new")
+    redis.read_gate.set()
+
+    assert await reader == "old"
+    redis.read_gate = None
+    assert await cache.get("k") == "new"
+
+
+@pytest.mark.asyncio
+async def test_delete_during_redis_read_is_not_undone_locally(cache, redis):
+    await cache.set("k", "old")
+    redis.read_gate = asyncio.Event()
+
+    reader = asyncio.create_task(cache.get("k"))
+    await asyncio.sleep(0)
+    await cache.delete("k")
+    redis.read_gate.set()
+    await reader
+
+    redis.read_gate = None
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_set_evicts_local_copy(cache, redis):
+    await cache.set("k", 1)
+    assert await cache.get("k") == 1
+
+    await cache.set("k", 2)
+
+    assert await cache.get("k") == 2
+    assert orjson.loads(redis.data["k"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_one_mget_for_a_small_batch(cache, redis):
+    redis.data.update({"a": b"1", "b": b"not json"})
+
+    assert await cache.get_many(["a", "b", "missing"]) == {"a": 1}
+    assert redis.mgets == [["a", "b", "missing"]]
+    assert redis.executes == []
+
+
+@pytest.mark.asyncio
+async def test_get_many_pipelines_mget_chunks_above_batch_size(cache, redis):
+    keys = [f"k{i}" for i in range(GET_MANY_BATCH_SIZE * 2 + 1)]
+    redis.data.update({key: orjson.dumps(i) for i, key in enumerate(keys)})
+
+    result = await cache.get_many(keys)
+
+    assert result == {key: i for i, key in enumerate(keys)}
+    assert redis.mgets == []
+    assert redis.executes == [["mget", "mget", "mget"]]
+
+
+@pytest.mark.asyncio
+async def test_set_many_sends_values_and_ttl_in_one_script_call(cache, redis, monkeypatch):
+    monkeypatch.setattr(cache_module.settings, "CACHE_TTL", 300)
+
+    assert await cache.set_many({"a": 1, "b": {"c": 2}})
+    assert await cache.set_many({"d": 3}, ttl=60)
+
+    keys, args = cache._set_many_script.calls[0]
+    assert keys == ["a", "b"]
+    assert args == [b"1", b'{"c":2}', 300]
+    assert redis.ttls == {"a": 300, "b": 300, "d": 60}
+
+
+@pytest.mark.asyncio
+async def test_set_many_evicts_local_copies(cache, redis):
+    await cache.set("a", 1)
+    assert await cache.get("a") == 1
+
+    await cache.set_many({"a": 2})
+
+    assert await cache.get("a") == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_pattern_unlinks_in_batches(cache, redis):
+    redis.data.update({f"user:{i}": b"1" for i in range(CLEAR_BATCH_SIZE + 3)})
+    redis.data["idea:1"] = b"1"
+
+    assert await cache.clear_pattern("user:*") == CLEAR_BATCH_SIZE + 3
+
+    assert list(redis.data) == ["idea:1"]
+    assert [len(batch) for batch in redis.executes] == [CLEAR_BATCH_SIZE, 3]
+    assert redis.scan_counts == [CLEAR_BATCH_SIZE]
+
+
+@pytest.mark.asyncio
+async def test_calls_without_a_client_miss_instead_of_raising():
+    cache = CacheManager("redis://unused")
+
+    assert await cache.get("k") is None
+    assert await cache.set("k", 1) is False
+    assert await cache.delete("k") is False
+    assert await cache.exists("k") is False
+    assert await cache.increment("k") is None
+    assert await cache.expire("k", 10) is False
+    assert await cache.get_many(["k"]) == {}
+    assert await cache.set_many({"k": 1}) is False
+    assert await cache.clear_pattern("k*") == 0
+    assert (await cache.health_check())["redis"] == "unhealthy"
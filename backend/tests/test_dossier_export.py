@@ -0,0 +1,106 @@
+"""Tests for dossier export serialization."""
+
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from app.models.dossier import Dossier, DossierExport, DossierStatus, DossierType
+from app.models.idea import Idea
+
+
+def make_dossier(**overrides) -> Dossier:
+    values = {
+        "id": 7,
+        "title": "Launchloom",
+        "created_at": datetime(2024, 5, 20, 12, 30, tzinfo=timezone.utc),
+        "prd_content": "# PRD",
+        "runbook_content": None,
+        "repo_structure": "src/",
+        "api_sketch": None,
+        "wireframes": {"home": ["hero"]},
+        "version": 2,
+        "type": DossierType.PREMIUM,
+    }
+    values.update(overrides)
+    return Dossier(**values)
+
+
+def test_to_export_struct_without_idea():
+    export = make_dossier().to_export_struct()
+
+    assert isinstance(export, DossierExport)
+    assert export.id == "7"
+    assert export.idea_text == ""
+    assert export.one_liner == ""
+    assert export.scores == {}
+    assert export.runbook == ""
+    assert export.api == ""
+
+
+def test_to_export_struct_uses_idea_fields():
+    source = Idea(
+        one_liner="Ideas to startups",
+        description="Turns an idea into a dossier",
+        total_score=80,
+        desirability_score=20,
+        feasibility_score=15,
+        viability_score=15,
+        defensibility_score=15,
+        timing_score=15,
+    )
+    export = make_dossier(idea=source).to_export_struct()
+
+    assert export.idea_text == "Turns an idea into a dossier"
+    assert export.one_liner == "Ideas to startups"
+    assert export.scores["total"] == 80
+
+
+def test_export_json_matches_export_dict():
+    dossiers = [make_dossier(), make_dossier(id=8, title="Second")]
+
+    exported = orjson.loads(Dossier.export_json(dossiers))
+
+    assert exported == [orjson.loads(orjson.dumps(d.to_export_dict())) for d in dossiers]
+    assert exported[0]["created_at"] == "2024-05-20T12:30:00+00:00"
+    assert exported[1]["type"] == "premium"
+
+
+def test_track_export_sets_timestamp():
+    dossier = make_dossier(export_count=0)
+
+    dossier.track_export()
+
+    assert dossier.export_count == 1
+    assert isinstance(dossier.last_exported_at, datetime)
+
+
+def test_export_struct_has_no_instance_dict():
+    export = make_dossier().to_export_struct()
+
+    assert not hasattr(export, "__dict__")
+
+
+@pytest.mark.parametrize(
+    ("artifacts", "expected"),
+    [
+        ({}, 0),
+        ({"prd_content": "# PRD"}, 25),
+        ({"prd_content": "# PRD", "api_sketch": "GET /"}, 50),
+        ({"prd_content": "# PRD", "runbook_content": "1.", "repo_structure": "src/", "api_sketch": "GET /"}, 100),
+    ],
+)
+def test_completion_percentage_counts_present_artifacts(artifacts, expected):
+    empty = {"prd_content": None, "runbook_content": None, "repo_structure": None, "api_sketch": None}
+    dossier = make_dossier(status=DossierStatus.PROCESSING, **{**empty, **artifacts})
+
+    assert dossier.completion_percentage == expected
+
+
+def test_export_with_missing_artifacts_uses_empty_strings():
+    dossier = make_dossier(prd_content=None, repo_structure="")
+
+    export = dossier.to_export_struct()
+
+    assert (export.prd, export.runbook, export.repo, export.api) == ("", "", "", "")
+    assert orjson.loads(Dossier.export_json([dossier]))[0]["prd"] == ""
@@ -0,0 +1,183 @@
+"""Tests for token, password and CSRF helpers."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from jose import jws
+
+from app.core import security
+from app.core.config import settings
+
+
+@pytest.fixture(autouse=True)
+def clear_token_caches():
+    security._token_cache.clear()
+    security._request_token_cache.set(None)
+    yield
+    security._token_cache.clear()
+    security._request_token_cache.set(None)
+
+
+def sign(payload) -> str:
+    return jws.sign(orjson.dumps(payload), settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+def claims(**overrides) -> dict:
+    now = int(time.time())
+    values = {"sub": "42", "type": security.TOKEN_TYPE_ACCESS, "iat": now, "exp": now + 60}
+    values.update(overrides)
+    return values
+
+
+def assert_rejected(token: str, token_type: str = security.TOKEN_TYPE_ACCESS) -> HTTPException:
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_token(token, token_type)
+    assert exc_info.value.status_code == 401
+    return exc_info.value
+
+
+def test_access_token_round_trip():
+    token = security.create_access_token(42)
+
+    assert security.verify_token(token) == "42"
+    # Served from the verified-payload cache the second time
+    assert security.verify_token(token) == "42"
+
+
+def test_refresh_token_round_trip():
+    token = security.create_refresh_token("user@example.com")
+
+    assert security.verify_token(token, security.TOKEN_TYPE_REFRESH) == "user@example.com"
+
+
+def test_wrong_token_type_rejected():
+    token = security.create_refresh_token(42)
+
+    error = assert_rejected(token, security.TOKEN_TYPE_ACCESS)
+    assert "Invalid token type" in error.detail
+
+
+def test_expired_token_rejected():
+    token = security.create_access_token(42, expires_delta=timedelta(seconds=-10))
+
+    assert_rejected(token)
+
+
+def test_cached_token_rejected_after_expiry(monkeypatch):
+    token = security.create_access_token(42, expires_delta=timedelta(seconds=30))
+    security.start_request_token_cache()
+    assert security.verify_token(token) == "42"
+
+    later = time.time() + 60
+    monkeypatch.setattr(security.time, "time", lambda: later)
+
+    # Both the per-request and the TTL cache must re-check exp
+    assert_rejected(token)
+    security._request_token_cache.set(None)
+    assert_rejected(token)
+
+
+def test_bad_signature_rejected():
+    token = jws.sign(orjson.dumps(claims()), "some-other-key", algorithm=settings.JWT_ALGORITHM)
+
+    assert_rejected(token)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"nbf": int(time.time()) + 3600},
+        {"aud": "someone-else"},
+        {"sub": 42},
+        {"iat": "yesterday"},
+        {"exp": "never"},
+    ],
+    ids=["nbf-in-future", "audience", "non-string-sub", "bad-iat", "bad-exp"],
+)
+def test_invalid_claims_rejected(overrides):
+    assert_rejected(sign(claims(**overrides)))
+
+
+def test_non_object_payload_rejected():
+    assert_rejected(sign(["not", "a", "dict"]))
+
+
+def test_token_without_subject_rejected():
+    payload = claims()
+    del payload["sub"]
+
+    error = assert_rejected(sign(payload))
+    assert "no subject" in error.detail
+
+
+@pytest.mark.parametrize("algorithm", ["bcrypt", "argon2id"])
+def test_password_hash_round_trip(monkeypatch, algorithm):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ALGORITHM", algorithm)
+
+    hashed = security.get_password_hash("correct horse")
+
+    assert hashed.startswith(security.ARGON2_HASH_PREFIX) == (algorithm == "argon2id")
+    assert security.verify_password("correct horse", hashed)
+    assert not security.verify_password("wrong horse", hashed)
+
+
+def test_existing_bcrypt_hash_verifies_after_switching_to_argon2(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ALGORITHM", "bcrypt")
+    bcrypt_hash = security.get_password_hash("correct horse")
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ALGORITHM", "argon2id")
+
+    assert security.verify_password("correct horse", bcrypt_hash)
+    assert security.get_password_hash("correct horse").startswith(security.ARGON2_HASH_PREFIX)
+
+
+def test_malformed_hash_does_not_verify():
+    assert not security.verify_password("correct horse", "not-a-hash")
+    assert not security.verify_password("correct horse", "$argon2id$garbage")
+
+
+@pytest.mark.asyncio
+async def test_async_password_helpers():
+    hashed = await security.get_password_hash_async("correct horse")
+
+    assert await security.verify_password_async("correct horse", hashed)
+    assert not await security.verify_password_async("wrong horse", hashed)
+
+
+def test_csrf_token_validation():
+    token = security.create_csrf_token()
+
+    assert len(token) == security.CSRF_TOKEN_LENGTH
+    assert security.validate_csrf_token(token, token)
+    assert not security.validate_csrf_token(security.create_csrf_token(), token)
+    assert not security.validate_csrf_token(token[:-1], token)
+    assert not security.validate_csrf_token("é" * security.CSRF_TOKEN_LENGTH, token)
+
+
+def test_token_cache_is_safe_across_threads():
+    tokens = [security.create_access_token(n) for n in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        subjects = list(pool.map(security.verify_token, tokens * 5))
+
+    assert subjects == [str(n) for n in range(200)] * 5
+
+
+@pytest.mark.asyncio
+async def test_request_token_cache_middleware_isolates_requests():
+    seen = []
+
+    async def endpoint(scope, receive, send):
+        seen.append(security._request_token_cache.get())
+
+    middleware = security.RequestTokenCacheMiddleware(endpoint)
+    await middleware({"type": "lifespan"}, None, None)
+    await middleware({"type": "http"}, None, None)
+    await middleware({"type": "http"}, None, None)
+
+    assert seen[0] is None
+    assert seen[1] == {} and seen[2] == {}
+    assert seen[1] is not seen[2]
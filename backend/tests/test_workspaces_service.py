@@ -0,0 +1,226 @@
+"""Tests for workspace creation and slug allocation."""
+
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes import workspaces as routes
+from app.models.workspace import MembershipStatus, Workspace, WorkspaceMember, WorkspaceRole
+from app.schemas.workspace import WorkspaceCreate, WorkspaceMemberCreate
+from app.services import workspaces as service
+
+
+class FakeResult:
+    def __init__(self, rows: list[Any]):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def scalar_one(self):
+        return self._rows[0]
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+    one_or_none = scalar_one_or_none
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class FakeSession:
+    """AsyncSession stand-in that returns scripted results in order."""
+
+    def __init__(self, *results: list[Any]):
+        self._results = list(results)
+        self.statements: list[Any] = []
+        self.params: list[Any] = []
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        return FakeResult(self._results.pop(0))
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def inserted_slug(statement) -> str:
+    return statement.compile(dialect=postgresql.dialect()).params["slug"]
+
+
+def compiled_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def workspace(slug: str, workspace_id: int = 1) -> Workspace:
+    return Workspace(id=workspace_id, name="My Workspace", slug=slug)
+
+
+@pytest.mark.asyncio
+async def test_create_workspace_uses_bare_slug_when_free():
+    db = FakeSession([workspace("my-workspace")])
+
+    created = await service.create_workspace(db, WorkspaceCreate(name="My Workspace"))
+
+    assert created.slug == "my-workspace"
+    assert created.members == []
+    assert len(db.statements) == 1
+    assert inserted_slug(db.statements[0]) == "my-workspace"
+    assert db.committed
+
+
+@pytest.mark.asyncio
+async def test_create_workspace_numbers_slug_after_conflict():
+    db = FakeSession(
+        [],  # bare slug already taken
+        [("my-workspace", 3)],  # highest existing suffix
+        [workspace("my-workspace-4")],
+    )
+
+    created = await service.create_workspace(db, WorkspaceCreate(name="My Workspace"))
+
+    assert created.slug == "my-workspace-4"
+    assert len(db.statements) == 3
+    assert inserted_slug(db.statements[0]) == "my-workspace"
+    assert inserted_slug(db.statements[2]) == "my-workspace-4"
+    assert db.committed
+
+
+@pytest.mark.asyncio
+async def test_create_workspace_raises_when_numbered_slug_is_taken():
+    db = FakeSession([], [("my-workspace", 1)], [])
+
+    with pytest.raises(service.WorkspaceAlreadyExistsError):
+        await service.create_workspace(db, WorkspaceCreate(name="My Workspace"))
+
+    assert inserted_slug(db.statements[2]) == "my-workspace-2"
+    assert db.rolled_back
+    assert not db.committed
+
+
+@pytest.mark.asyncio
+async def test_create_workspace_explicit_slug_conflict_is_not_renumbered():
+    db = FakeSession([])
+
+    with pytest.raises(service.WorkspaceAlreadyExistsError):
+        await service.create_workspace(db, WorkspaceCreate(name="My Workspace", slug="taken"))
+
+    assert len(db.statements) == 1
+    assert db.rolled_back
+
+
+@pytest.mark.asyncio
+async def test_create_workspace_inserts_members_in_one_statement():
+    owner = WorkspaceMember(id=1, email="owner@example.com", role=WorkspaceRole.OWNER)
+    viewer = WorkspaceMember(id=2, email="viewer@example.com", role=WorkspaceRole.VIEWER)
+    db = FakeSession([workspace("my-workspace")], [owner, viewer])
+
+    created = await service.create_workspace(
+        db,
+        WorkspaceCreate(name="My Workspace"),
+        members=[
+            WorkspaceMemberCreate(email="owner@example.com", role=WorkspaceRole.OWNER),
+            WorkspaceMemberCreate(email="viewer@example.com"),
+        ],
+    )
+
+    assert created.members == [owner, viewer]
+    assert len(db.statements) == 2
+    # Owners join immediately; everyone else starts out invited
+    assert [row["status"] for row in db.params[1]] == [MembershipStatus.ACTIVE, MembershipStatus.INVITED]
+    assert all(row["workspace_id"] == 1 for row in db.params[1])
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_workspaces_numbers_duplicates_after_one_lookup():
+    db = FakeSession(
+        [workspace("launchloom", 1)],
+        [("launchloom", 2)],
+        [workspace("launchloom-3", 2), workspace("launchloom-4", 3)],
+    )
+
+    created = await service.bulk_create_workspaces(
+        db,
+        [WorkspaceCreate(name="Launchloom") for _ in range(3)],
+    )
+
+    assert [w.slug for w in created] == ["launchloom", "launchloom-3", "launchloom-4"]
+    assert len(db.statements) == 3
+    assert db.committed
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_workspaces_returns_input_order():
+    db = FakeSession(
+        # RETURNING order is not guaranteed to follow the VALUES list
+        [workspace("beta", 2), workspace("alpha", 1)],
+        [("beta", 1)],
+        [workspace("beta-2", 3)],
+    )
+
+    created = await service.bulk_create_workspaces(
+        db,
+        [WorkspaceCreate(name="Beta"), WorkspaceCreate(name="Alpha"), WorkspaceCreate(name="Beta")],
+    )
+
+    assert [w.slug for w in created] == ["beta", "alpha", "beta-2"]
+    assert [w.id for w in created] == [2, 1, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("reltuples", "expected"), [(-1, None), (None, None), (0, 0), (1200, 1200)])
+async def test_estimate_row_count_is_none_without_statistics(reltuples, expected):
+    db = FakeSession([reltuples] if reltuples is not None else [])
+
+    assert await service.estimate_row_count(db, "workspaces") == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("reltuples", "offset"), [(-1, 0), (5, 10)])
+async def test_list_endpoint_counts_when_estimate_is_missing_or_stale(reltuples, offset):
+    db = FakeSession([], [reltuples], [12])
+
+    response = await routes.list_workspaces_endpoint(
+        db=db, limit=50, offset=offset, cursor=None, exact_count=False
+    )
+
+    assert response.estimated_total == 12
+    assert response.total is None
+    assert "count(*)" in compiled_sql(db.statements[2])
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_keeps_a_plausible_estimate():
+    db = FakeSession([], [1200])
+
+    response = await routes.list_workspaces_endpoint(
+        db=db, limit=50, offset=0, cursor=None, exact_count=False
+    )
+
+    assert response.estimated_total == 1200
+    assert len(db.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_load_workspace_falls_back_to_slug_for_uuid_shaped_identifier():
+    identifier = "0b6f1a52-3c1e-4d3a-9f7e-2a1b4c5d6e7f"
+    found = workspace(identifier)
+    db = FakeSession([workspace("launchloom")], [], [found])
+
+    assert await service.load_workspace(db, "launchloom") is not None
+    assert await service.load_workspace(db, identifier) is found
+
+    assert "workspaces.slug =" in compiled_sql(db.statements[0])
+    assert "workspaces.public_id =" in compiled_sql(db.statements[1])
+    assert "workspaces.slug =" in compiled_sql(db.statements[2])